@@ -11,6 +11,7 @@ import os
 import sys
 import shutil
 import subprocess
+from datetime import datetime
 from pathlib import Path
 
 def clean_build_dirs():
@@ -36,17 +37,10 @@ def create_version_file():
     print("创建版本信息文件...")
     
     version = "1.0.0"
-    try:
-        # 尝试使用UTF-8解码
-        build_time = subprocess.check_output(
-            "echo %date% %time%", shell=True
-        ).decode('utf-8').strip()
-    except UnicodeDecodeError:
-        # 如果失败，尝试使用系统默认编码（中文Windows通常是GBK）
-        build_time = subprocess.check_output(
-            "echo %date% %time%", shell=True
-        ).decode('gbk', errors='replace').strip()
-    
+    # 进程内获取时间，无需派生 cmd.exe 也无编码问题
+    build_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
     with open('version.txt', 'w', encoding='utf-8') as f:
         f.write(f"Version: {version}\n")
         f.write(f"Build time: {build_time}\n")
@@ -64,7 +58,19 @@ def build_executable():
         '--clean',
         '--name=WinTask',
         '--noconsole',  # 无控制台窗口
-        '--onefile',    # 单文件模式
+        '--onedir',     # 目录模式，启动时无需自解压，冷启动更快
+        # 排除未使用的 Qt 子模块和标准库，减小体积、加快启动
+        '--exclude-module=PyQt5.QtWebEngine',
+        '--exclude-module=PyQt5.QtWebEngineWidgets',
+        '--exclude-module=PyQt5.QtQml',
+        '--exclude-module=PyQt5.QtQuick',
+        '--exclude-module=PyQt5.Qt3DCore',
+        '--exclude-module=PyQt5.QtMultimedia',
+        '--exclude-module=PyQt5.QtSql',
+        '--exclude-module=PyQt5.QtTest',
+        '--exclude-module=tkinter',
+        '--exclude-module=pydoc_data',
+        '--exclude-module=unittest',
         # '--icon=assets/icons/app_icon.ico',  # 暂时注释掉图标
         '--add-data=config.ini;.',
         '--add-data=version.txt;.',
@@ -86,10 +92,11 @@ def copy_additional_files():
     release_dir = os.path.join('dist', 'release')
     os.makedirs(release_dir, exist_ok=True)
     
-    # 复制可执行文件
-    shutil.copy(
-        os.path.join('dist', 'WinTask.exe'), 
-        os.path.join(release_dir, 'WinTask.exe')
+    # 复制整个应用目录（onedir 模式）
+    shutil.copytree(
+        os.path.join('dist', 'WinTask'),
+        os.path.join(release_dir, 'WinTask'),
+        dirs_exist_ok=True
     )
     
     # 复制README和许可证文件
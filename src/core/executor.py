@@ -9,115 +9,106 @@
 
 import time
 import logging
-import threading
-from datetime import datetime
 
-from src.core.task import BaseTask, TaskStatus, TaskResult
+# 任务类型延迟导入，executor 模块本身的导入近乎零成本
+BaseTask = TaskStatus = TaskResult = None
+
+
+def _load_task_types():
+    """按需导入任务类型并缓存到模块全局"""
+    global BaseTask, TaskStatus, TaskResult
+    if BaseTask is None:
+        from src.core.task import (
+            BaseTask as _base_task,
+            TaskStatus as _task_status,
+            TaskResult as _task_result,
+        )
+        BaseTask = _base_task
+        TaskStatus = _task_status
+        TaskResult = _task_result
 
 
 class TaskExecutor:
     """任务执行器"""
-    
-    def __init__(self):
-        """初始化任务执行器"""
+
+    def __init__(self, max_workers=10):
+        """
+        初始化任务执行器
+
+        参数:
+            max_workers (int): 保留参数以兼容既有调用方（执行器不再
+                持有自己的线程池）
+        """
         self.logger = logging.getLogger("executor")
         self.logger.info("初始化任务执行器")
-        
-        # 当前执行中的任务
+
+        # 确保任务类型已加载
+        _load_task_types()
+
+        # 当前执行中的任务，值为 (task, start_time) 元组
+        # 单键的插入/删除在 CPython 中由 GIL 保证原子性，无需额外加锁
         self.running_tasks = {}
-        
-        # 任务执行锁
-        self.task_lock = threading.Lock()
-    
+
     def execute(self, task):
         """
         执行任务
-        
+
         参数:
             task (BaseTask): 要执行的任务
-            
+
         返回:
             TaskResult: 任务执行结果
         """
-        if not isinstance(task, BaseTask):
-            raise TypeError("任务必须是BaseTask的子类")
-        
+        # 仅在调试模式下检查类型，-O 优化运行时会剥离该断言
+        assert isinstance(task, BaseTask), "任务必须是BaseTask的子类"
+
         self.logger.info(f"开始执行任务: {task.name} [{task.id}]")
-        
+
         # 添加到运行中的任务
-        with self.task_lock:
-            self.running_tasks[task.id] = {
-                'task': task,
-                'start_time': datetime.now()
-            }
-        
-        # 使用线程来支持超时控制
-        result = TaskResult()
-        result_container = {'result': None}
-        
-        # 创建执行线程
-        execution_thread = threading.Thread(
-            target=self._execute_task_thread,
-            args=(task, result_container)
-        )
-        execution_thread.daemon = True
-        
+        self.running_tasks[task.id] = (task, time.monotonic())
+
+        # 快乐路径直接使用 task.execute() 返回的结果，
+        # 只在超时/异常分支才额外分配 TaskResult
+        result = None
+
         try:
-            # 开始执行
-            result.start()
-            execution_thread.start()
-            
-            # 等待执行完成或超时
-            if task.timeout > 0:
-                execution_thread.join(task.timeout)
-                if execution_thread.is_alive():
-                    # 任务超时
-                    self.logger.warning(f"任务超时: {task.name} [{task.id}] (超时: {task.timeout}秒)")
-                    result.complete(TaskStatus.TIMEOUT, -1, "", "任务执行超时")
-            else:
-                # 如果没有超时设置，等待任务完成
-                execution_thread.join()
-            
-            # 获取结果
-            if result_container['result'] is not None and result.status != TaskStatus.TIMEOUT:
-                result = result_container['result']
-            
+            # 超时控制由 BaseTask.execute 统一负责（task.timeout），
+            # 这里不再叠加第二层计时器和线程
+            result = task.execute()
+
         except Exception as e:
             # 捕获异常
             error_msg = f"任务执行异常: {str(e)}"
             self.logger.exception(f"任务 {task.name} [{task.id}] 执行出错: {str(e)}")
+            result = TaskResult()
             result.complete(TaskStatus.FAILED, -1, "", error_msg)
-        
+
         finally:
             # 从运行中的任务移除
-            with self.task_lock:
-                if task.id in self.running_tasks:
-                    # 计算执行时间
-                    start_time = self.running_tasks[task.id]['start_time']
-                    execution_time = (datetime.now() - start_time).total_seconds()
-                    self.logger.info(f"任务 {task.name} [{task.id}] 执行完成，耗时: {execution_time:.2f}秒")
-                    del self.running_tasks[task.id]
-        
+            info = self.running_tasks.pop(task.id, None)
+            if info is not None:
+                # 计算执行时间，单调时钟不受系统时间调整影响
+                execution_time = time.monotonic() - info[1]
+                self.logger.info(f"任务 {task.name} [{task.id}] 执行完成，耗时: {execution_time:.2f}秒")
+
+        if result is None:
+            # 理论上不会发生，兜底保证总是返回 TaskResult
+            result = TaskResult()
+            result.complete(TaskStatus.FAILED, -1, "", "任务未产生执行结果")
+
         return result
-    
-    def _execute_task_thread(self, task, result_container):
+
+    def shutdown(self, wait=True):
         """
-        在线程中执行任务
-        
+        关闭任务执行器
+
+        执行不再持有自己的线程池（任务在调用方线程运行，超时由
+        BaseTask.execute 的守护线程承载），这里只记录关闭日志。
+
         参数:
-            task (BaseTask): 要执行的任务
-            result_container (dict): 用于存储结果的容器
+            wait (bool): 保留参数以兼容既有调用方
         """
-        try:
-            # 调用任务的执行方法
-            result = task.execute()
-            result_container['result'] = result
-        except Exception as e:
-            # 捕获任务执行异常
-            self.logger.exception(f"任务线程异常: {str(e)}")
-            result = TaskResult()
-            result.complete(TaskStatus.FAILED, -1, "", f"任务执行线程异常: {str(e)}")
-            result_container['result'] = result
+        self.logger.info("关闭任务执行器")
     
     def get_running_tasks(self):
         """
@@ -126,8 +117,8 @@ class TaskExecutor:
         返回:
             dict: 运行中的任务字典
         """
-        with self.task_lock:
-            return {task_id: info['task'] for task_id, info in self.running_tasks.items()}
+        # list() 对字典做原子快照，无需加锁
+        return {task_id: info[0] for task_id, info in list(self.running_tasks.items())}
     
     def cancel_task(self, task_id):
         """
@@ -142,16 +133,15 @@ class TaskExecutor:
         返回:
             bool: 操作是否成功
         """
-        with self.task_lock:
-            if task_id not in self.running_tasks:
-                return False
-            
-            task_info = self.running_tasks[task_id]
-            task = task_info['task']
-            
-            # 标记任务为已取消
-            task.status = TaskStatus.CANCELED
-            
-            self.logger.info(f"取消任务: {task.name} [{task.id}]")
-            
-            return True 
\ No newline at end of file
+        info = self.running_tasks.get(task_id)
+        if info is None:
+            return False
+
+        task = info[0]
+
+        # 标记任务为已取消
+        task.status = TaskStatus.CANCELED
+
+        self.logger.info(f"取消任务: {task.name} [{task.id}]")
+
+        return True 
\ No newline at end of file
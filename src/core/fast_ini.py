@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+轻量 INI 解析器模块
+
+本项目的配置文件只使用 [节] + key = value 的简单布局，
+不涉及插值、多行值和行内注释，完整的 configparser 机制在
+启动路径上是纯粹的开销。这里用两个预编译正则单遍解析，
+并保持与 configparser 字典用法兼容的接口。
+"""
+
+import re
+
+# 节头与键值行的预编译正则
+_SECTION_RE = re.compile(r'^\[([^\]]+)\]\s*$')
+_ENTRY_RE = re.compile(r'^([^=;#\s][^=]*?)\s*=\s*(.*)$')
+
+
+class FastIni:
+    """轻量 INI 配置解析器"""
+
+    def __init__(self):
+        # 节名 -> {键: 字符串值}
+        self._sections = {}
+
+    def read(self, file_path, encoding='utf-8'):
+        """
+        读取并解析配置文件
+
+        参数:
+            file_path (str): 配置文件路径
+            encoding (str): 文件编码
+        """
+        with open(file_path, 'r', encoding=encoding) as f:
+            self.read_string(f.read())
+
+    def read_string(self, text):
+        """
+        解析配置字符串
+
+        参数:
+            text (str): INI 格式的配置内容
+        """
+        current = None
+        for line in text.splitlines():
+            line = line.strip()
+
+            # 跳过空行和注释行
+            if not line or line[0] in (';', '#'):
+                continue
+
+            match = _SECTION_RE.match(line)
+            if match:
+                current = self._sections.setdefault(match.group(1), {})
+                continue
+
+            match = _ENTRY_RE.match(line)
+            if match and current is not None:
+                current[match.group(1)] = match.group(2)
+
+    def dumps(self):
+        """
+        序列化为 INI 格式字符串
+
+        返回:
+            str: INI 格式的配置内容
+        """
+        parts = []
+        for section, entries in self._sections.items():
+            parts.append(f'[{section}]\n')
+            for key, value in entries.items():
+                parts.append(f'{key} = {value}\n')
+            parts.append('\n')
+        return ''.join(parts)
+
+    def write(self, fp):
+        """
+        将配置写入文件对象
+
+        参数:
+            fp: 可写的文件对象
+        """
+        fp.write(self.dumps())
+
+    def sections(self):
+        """
+        获取所有节名
+
+        返回:
+            list: 节名列表
+        """
+        return list(self._sections.keys())
+
+    def __contains__(self, section):
+        return section in self._sections
+
+    def __getitem__(self, section):
+        return self._sections[section]
+
+    def __setitem__(self, section, entries):
+        self._sections[section] = dict(entries)
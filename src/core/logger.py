@@ -9,12 +9,27 @@
 
 import os
 import time
+import atexit
+import queue
 import logging
 import logging.handlers
+import threading
+from collections import deque
 from datetime import datetime, timedelta
 
 from src.core.settings import Settings
 
+# 共享的格式化器实例，避免每个处理器重复构造
+_STD_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+_ERR_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s\n%(pathname)s:%(lineno)d\n%(exc_text)s\n'
+)
+_TASK_FILE_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(levelname)s - %(message)s'
+)
+
 
 class LogManager:
     """日志管理器类"""
@@ -28,6 +43,15 @@ class LogManager:
         """
         # 如果没有传入设置对象，则创建一个
         self.settings = settings or Settings()
+
+        # 格式串中不使用线程/进程字段，关闭相关采集减少每条记录的开销
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
+        # 缓存设置值，避免各 configure_* 方法重复读取配置
+        self._log_level = getattr(logging, self.settings.log_level.upper(), logging.INFO)
+        self._retention_days = int(self.settings.log_retention_days)
         
         # 获取程序根目录
         base_dir = os.path.dirname(os.path.dirname(os.path.dirname(
@@ -37,13 +61,21 @@ class LogManager:
         self.log_dir = os.path.join(base_dir, 'data', 'logs')
         
         # 确保日志目录存在
-        if not os.path.exists(self.log_dir):
-            os.makedirs(self.log_dir)
+        os.makedirs(self.log_dir, exist_ok=True)
         
         # 日志文件
         self.main_log_file = os.path.join(self.log_dir, 'win-task.log')
         self.task_log_file = os.path.join(self.log_dir, 'task-execution.log')
         self.error_log_file = os.path.join(self.log_dir, 'error.log')
+
+        # 任务日志记录器缓存，避免重复创建文件处理器
+        self._task_logger_cache = {}
+        self._task_logger_lock = threading.Lock()
+
+        # 队列监听器列表，文件写入和格式化在监听线程完成，
+        # 产生日志的线程只付出入队成本
+        self._queue_listeners = []
+        atexit.register(self._stop_queue_listeners)
         
         # 配置主日志
         self.configure_main_logger()
@@ -54,17 +86,49 @@ class LogManager:
         # 配置错误日志
         self.configure_error_logger()
         
-        # 清理旧日志文件
-        self.clean_old_logs()
-        
+        # 在后台线程清理旧日志文件，避免阻塞启动
+        threading.Thread(
+            target=self.clean_old_logs,
+            daemon=True,
+            name='log-cleanup'
+        ).start()
+
         logging.info("日志管理器初始化完成")
-    
+
+    def _attach_queue_handler(self, logger, handlers):
+        """
+        为记录器挂接队列处理器
+
+        真正的文件/控制台处理器交给后台 QueueListener，
+        调用方线程的 logger.info 只需入队即可返回。
+
+        参数:
+            logger (logging.Logger): 要挂接的记录器
+            handlers (list): 实际执行输出的处理器列表
+        """
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+        listener = logging.handlers.QueueListener(
+            log_queue, *handlers, respect_handler_level=True
+        )
+        listener.start()
+        self._queue_listeners.append(listener)
+
+    def _stop_queue_listeners(self):
+        """停止所有队列监听器，冲刷剩余日志"""
+        for listener in self._queue_listeners:
+            try:
+                listener.stop()
+            except Exception:
+                pass
+        self._queue_listeners.clear()
+
     def configure_main_logger(self):
         """配置主日志记录器"""
-        # 获取日志级别
-        log_level_str = self.settings.log_level.upper()
-        log_level = getattr(logging, log_level_str, logging.INFO)
-        
+        # 获取缓存的日志级别
+        log_level = self._log_level
+
         # 创建主日志记录器
         logger = logging.getLogger()
         logger.setLevel(log_level)
@@ -76,30 +140,23 @@ class LogManager:
         # 控制台处理器
         console_handler = logging.StreamHandler()
         console_handler.setLevel(log_level)
-        console_format = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        console_handler.setFormatter(console_format)
+        console_handler.setFormatter(_STD_FORMATTER)
         
         # 文件处理器
         file_handler = logging.handlers.TimedRotatingFileHandler(
             self.main_log_file, 
-            when='midnight', 
+            when='midnight',
             interval=1,
-            backupCount=self.settings.log_retention_days,
+            backupCount=self._retention_days,
             encoding='utf-8'  # 明确指定UTF-8编码
         )
         file_handler.setLevel(log_level)
-        file_format = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        file_handler.setFormatter(file_format)
-        
-        # 添加处理器
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
-        
-        logging.info(f"主日志配置完成，级别: {log_level_str}, 文件: {self.main_log_file}")
+        file_handler.setFormatter(_STD_FORMATTER)
+
+        # 经由队列挂接处理器，I/O 在后台监听线程执行
+        self._attach_queue_handler(logger, [console_handler, file_handler])
+
+        logging.info(f"主日志配置完成，级别: {logging.getLevelName(log_level)}, 文件: {self.main_log_file}")
     
     def configure_task_logger(self):
         """配置任务日志记录器"""
@@ -115,20 +172,17 @@ class LogManager:
         # 文件处理器
         task_handler = logging.handlers.TimedRotatingFileHandler(
             self.task_log_file, 
-            when='midnight', 
+            when='midnight',
             interval=1,
-            backupCount=self.settings.log_retention_days,
+            backupCount=self._retention_days,
             encoding='utf-8'  # 明确指定UTF-8编码
         )
         task_handler.setLevel(logging.INFO)
-        task_format = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        task_handler.setFormatter(task_format)
-        
-        # 添加处理器
-        task_logger.addHandler(task_handler)
-        
+        task_handler.setFormatter(_STD_FORMATTER)
+
+        # 经由队列挂接处理器，任务线程只付出入队成本
+        self._attach_queue_handler(task_logger, [task_handler])
+
         logging.info(f"任务日志配置完成，文件: {self.task_log_file}")
     
     def configure_error_logger(self):
@@ -150,39 +204,34 @@ class LogManager:
             encoding='utf-8'  # 明确指定UTF-8编码
         )
         error_handler.setLevel(logging.ERROR)
-        error_format = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s\n%(pathname)s:%(lineno)d\n%(exc_text)s\n'
-        )
-        error_handler.setFormatter(error_format)
-        
-        # 添加处理器
-        error_logger.addHandler(error_handler)
-        
+        error_handler.setFormatter(_ERR_FORMATTER)
+
+        # 经由队列挂接处理器
+        self._attach_queue_handler(error_logger, [error_handler])
+
         logging.info(f"错误日志配置完成，文件: {self.error_log_file}")
     
     def clean_old_logs(self):
         """清理过期的日志文件"""
         try:
-            # 获取日志保留天数
-            retention_days = self.settings.log_retention_days
-            
+            # 获取缓存的日志保留天数
+            retention_days = self._retention_days
+
             # 计算截止日期
             cutoff_date = datetime.now() - timedelta(days=retention_days)
             cutoff_timestamp = cutoff_date.timestamp()
             
-            # 遍历日志目录
-            for filename in os.listdir(self.log_dir):
-                file_path = os.path.join(self.log_dir, filename)
-                
-                # 检查是否是文件
-                if os.path.isfile(file_path):
-                    # 获取文件修改时间
-                    file_mtime = os.path.getmtime(file_path)
-                    
+            # 遍历日志目录，scandir 的 DirEntry 缓存了 stat 信息，减少系统调用
+            with os.scandir(self.log_dir) as it:
+                for entry in it:
+                    # 只处理日志文件
+                    if not entry.name.endswith('.log') or not entry.is_file():
+                        continue
+
                     # 如果文件修改时间早于截止日期，则删除
-                    if file_mtime < cutoff_timestamp:
-                        os.remove(file_path)
-                        logging.debug(f"删除过期日志文件: {file_path}")
+                    if entry.stat().st_mtime < cutoff_timestamp:
+                        os.remove(entry.path)
+                        logging.debug(f"删除过期日志文件: {entry.path}")
             
             logging.info(f"清理完成，删除超过 {retention_days} 天的日志文件")
         except Exception as e:
@@ -198,30 +247,36 @@ class LogManager:
         返回:
             logging.Logger: 任务专用的日志记录器
         """
-        # 创建任务专用的日志文件
-        task_log_file = os.path.join(self.log_dir, f'task-{task_id}.log')
-        
-        # 创建任务专用的日志记录器
-        task_logger = logging.getLogger(f'task.{task_id}')
-        task_logger.setLevel(logging.INFO)
-        
-        # 清除现有的处理器
-        for handler in task_logger.handlers[:]:
-            task_logger.removeHandler(handler)
-        
-        # 添加文件处理器
-        task_handler = logging.FileHandler(task_log_file, encoding='utf-8')  # 明确指定UTF-8编码
-        task_handler.setLevel(logging.INFO)
-        task_format = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s'
-        )
-        task_handler.setFormatter(task_format)
-        task_logger.addHandler(task_handler)
-        
-        # 设置为不传递到父记录器，避免日志重复
-        task_logger.propagate = False
-        
-        return task_logger
+        # 命中缓存直接返回，避免重复打开文件处理器
+        task_logger = self._task_logger_cache.get(task_id)
+        if task_logger is not None:
+            return task_logger
+
+        with self._task_logger_lock:
+            # 双重检查，防止并发下重复创建
+            task_logger = self._task_logger_cache.get(task_id)
+            if task_logger is not None:
+                return task_logger
+
+            # 创建任务专用的日志文件
+            task_log_file = os.path.join(self.log_dir, f'task-{task_id}.log')
+
+            # 创建任务专用的日志记录器
+            task_logger = logging.getLogger(f'task.{task_id}')
+            task_logger.setLevel(logging.INFO)
+
+            # 添加文件处理器
+            task_handler = logging.FileHandler(task_log_file, encoding='utf-8')  # 明确指定UTF-8编码
+            task_handler.setLevel(logging.INFO)
+            task_handler.setFormatter(_TASK_FILE_FORMATTER)
+            task_logger.addHandler(task_handler)
+
+            # 设置为不传递到父记录器，避免日志重复
+            task_logger.propagate = False
+
+            self._task_logger_cache[task_id] = task_logger
+
+            return task_logger
     
     def get_log_files(self):
         """
@@ -256,13 +311,9 @@ class LogManager:
         try:
             # 使用tail命令的逻辑，读取文件最后N行
             with open(log_file, 'r', encoding='utf-8', errors='replace') as f:
-                # 使用循环缓冲区，只保留最后N行
-                buffer = []
-                for line in f:
-                    buffer.append(line)
-                    if len(buffer) > lines:
-                        buffer.pop(0)
-            
+                # deque(maxlen=N) 以 O(1) 滚动，只保留最后N行
+                buffer = deque(f, maxlen=lines)
+
             # 拼接结果
             return ''.join(buffer)
         except Exception as e:
@@ -12,6 +12,8 @@ import time
 import json
 import logging
 import threading
+import weakref
+import concurrent.futures
 from datetime import datetime, timedelta
 from croniter import croniter
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -24,24 +26,130 @@ from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MI
 
 from src.core.task import BaseTask, TaskStatus, TaskPriority
 from src.core.executor import TaskExecutor
+from src.core.settings import Settings
 from src.utils.notifier import Notifier
 from src.utils.path_utils import get_app_data_dir
 
 import random
 import re
+import functools
+
+# 可选的更快 JSON 编解码器，未安装 orjson 时回退到标准库
+try:
+    import orjson
+
+    def _json_dumps(obj):
+        """序列化为 UTF-8 字节串"""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        """序列化为 UTF-8 字节串"""
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+    _json_loads = json.loads
+
+# 间隔单位到秒数的换算表
+_UNIT_SECS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def _parse_cron(expr):
+    """解析 cron 表达式，返回 (触发器, 下次运行时间, 缓存的解析状态)"""
+    trigger = CronTrigger.from_crontab(expr)
+    # croniter 实例长期复用，每次触发只需推进
+    cron = croniter(expr, datetime.now())
+    return trigger, cron.get_next(datetime), ('cron', cron)
+
+
+def _parse_interval(expr):
+    """解析间隔表达式 n(s|m|h|d)，返回 (触发器, 下次运行时间, 缓存的解析状态)"""
+    unit = expr[-1]
+    if unit not in _UNIT_SECS:
+        raise ValueError(f"不支持的间隔单位: {unit}")
+    seconds = int(expr[:-1]) * _UNIT_SECS[unit]
+    trigger = IntervalTrigger(seconds=seconds)
+    return trigger, datetime.now() + timedelta(seconds=seconds), ('interval', seconds)
+
+
+def _parse_date(expr):
+    """解析指定日期时间 YYYY-MM-DD HH:MM:SS，返回 (触发器, 下次运行时间, 缓存的解析状态)"""
+    run_date = datetime.fromisoformat(expr)
+    return DateTrigger(run_date=run_date), run_date, ('date', run_date)
+
+
+# 调度表达式前缀到解析函数的分发表，取代 if/elif 级联
+_SCHED_HANDLERS = {
+    'cron': _parse_cron,
+    'interval': _parse_interval,
+    'date': _parse_date,
+}
+
+# 驼峰转下划线的正则，模块级预编译
+_CAMEL_TO_SNAKE = re.compile(r'([a-z])([A-Z])')
+
+
+@functools.lru_cache(maxsize=None)
+def _snake(name):
+    """驼峰类名转下划线模块名，结果全局缓存"""
+    return _CAMEL_TO_SNAKE.sub(r'\1_\2', name).lower()
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_task_class(task_type):
+    """
+    按名称解析任务类，结果全局缓存
+
+    参数:
+        task_type (str): 任务类名，如 FileTask
+
+    返回:
+        type: 任务类
+
+    抛出:
+        ImportError: 无法解析任务类型时
+    """
+    try:
+        task_module = __import__('src.tasks', fromlist=['tasks'])
+        if hasattr(task_module, task_type):
+            return getattr(task_module, task_type)
+
+        # 尝试通过模块名导入
+        module_name = _snake(task_type)
+        task_module = __import__(f'src.tasks.{module_name}', fromlist=[task_type])
+        return getattr(task_module, task_type)
+    except (ImportError, AttributeError) as e:
+        raise ImportError(f"无法导入任务类型 {task_type}: {str(e)}")
 
 
 class TaskScheduler:
     """任务调度器"""
     
-    def __init__(self):
-        """初始化调度器"""
+    def __init__(self, settings=None):
+        """
+        初始化调度器
+
+        参数:
+            settings (Settings, optional): 设置对象，如果为None则创建新实例
+        """
         self.logger = logging.getLogger("scheduler")
         self.logger.info("初始化任务调度器")
         
         # 任务存储
         self.tasks = {}
-        
+
+        # 反向索引：分组/状态/标签 -> 任务ID集合，避免按条件查询时全量扫描
+        self._by_group = {}
+        self._by_status = {}
+        self._by_tag = {}
+        # 记录每个任务在状态索引中所处的桶，便于状态变更时迁移
+        self._indexed_status = {}
+
+        # 依赖索引：dep_id -> 依赖它的任务ID集合；以及依赖已全部满足的任务ID集合
+        # 依赖检查从每次遍历退化为一次集合成员判断
+        self._reverse_deps = {}
+        self._deps_satisfied = set()
+
         # 创建APScheduler
         jobstores = {
             'default': MemoryJobStore()
@@ -70,17 +178,19 @@ class TaskScheduler:
         # 通知管理器
         self.notifier = Notifier()
         
-        # 任务执行锁
-        self.task_lock = threading.Lock()
+        # 运行中的任务，弱引用索引：强引用始终由 self.tasks 持有，
+        # 任务被删除后运行结束时对应条目自动消失，无需显式清理
+        self.running_tasks = weakref.WeakValueDictionary()
         
-        # 运行中的任务
-        self.running_tasks = {}
-        
-        # 配置参数
-        self.max_concurrent_tasks = 5
-        self.default_timeout = 3600
-        self.max_retries = 3
-        self.retry_interval = 60
+        # 配置参数：取一次冻结快照，运行中读取为纯属性访问
+        config = (settings or Settings()).scheduler_snapshot()
+        self.max_concurrent_tasks = config.max_concurrent_tasks
+        self.default_timeout = config.default_timeout
+        self.max_retries = config.max_retries
+        self.retry_interval = config.retry_interval
+
+        # 并发容量信号量：非阻塞获取失败即说明已满，无需加锁数数
+        self._capacity = threading.BoundedSemaphore(self.max_concurrent_tasks)
         
         # 获取应用数据目录
         app_data_dir = get_app_data_dir()
@@ -89,12 +199,31 @@ class TaskScheduler:
         self.data_dir = os.path.join(app_data_dir, 'tasks')
         self.backup_dir = os.path.join(app_data_dir, 'backups/tasks')
         self.log_dir = os.path.join(app_data_dir, 'logs')
+
+        # 统一任务存储文件（替代每任务一个 JSON 文件）
+        self.tasks_file = os.path.join(self.data_dir, 'tasks.json')
+
+        # 自上次保存以来有变更的任务ID，未变更的任务复用旧的序列化结果
+        self._dirty_ids = set()
+
+        # 任务序列化结果缓存：task_id -> to_dict() 结果，脏任务才重新序列化
+        self._payload_cache = {}
+
+        # 旧布局遗留的每任务文件，统一存储写盘成功后一次性清理
+        self._legacy_files = []
+
+        # 后台持久化线程：合并密集的保存请求，按需批量落盘
+        self._persist_event = threading.Event()
+        self._persist_stop = threading.Event()
+        self._persist_thread = None
+
+        # 保存互斥锁：save_tasks 会被持久化线程、任务结果回调和
+        # shutdown 并发调用，写同一个临时文件必须串行
+        self._save_lock = threading.Lock()
         
-        # 确保目录存在
+        # 目录只在初始化时创建一次，保存/加载热路径不再重复 stat
         for directory in [self.data_dir, self.backup_dir, self.log_dir]:
-            if not os.path.exists(directory):
-                os.makedirs(directory)
-                self.logger.info(f"创建目录: {directory}")
+            os.makedirs(directory, exist_ok=True)
     
     def start(self):
         """启动调度器"""
@@ -106,6 +235,14 @@ class TaskScheduler:
         
         # 再加载任务
         self.load_tasks()
+
+        # 启动后台持久化线程
+        self._persist_thread = threading.Thread(
+            target=self._persist_loop,
+            daemon=True,
+            name='task-persist'
+        )
+        self._persist_thread.start()
         
         # 已禁用自动备份任务
         # self.scheduler.add_job(
@@ -121,6 +258,13 @@ class TaskScheduler:
         self.logger.info("关闭任务调度器")
         if self.scheduler.running:
             self.scheduler.shutdown()
+        self.executor.shutdown()
+
+        # 停止后台持久化线程并做最终同步保存
+        self._persist_stop.set()
+        self._persist_event.set()
+        if self._persist_thread is not None:
+            self._persist_thread.join(timeout=10)
         self.save_tasks()
         # 备份功能已禁用
         # self.backup_tasks()
@@ -148,16 +292,18 @@ class TaskScheduler:
         
         # 添加到任务字典
         self.tasks[task.id] = task
-        
+        self._index_task(task)
+        self._dirty_ids.add(task.id)
+
         # 如果任务有调度表达式并且已启用，则调度任务
         if task.schedule and task.enabled:
             self._schedule_task(task)
-        
+
         self.logger.info(f"添加任务: {task.name} [{task.id}]")
-        
+
         # 保存任务
-        self.save_tasks()
-        
+        self._request_save()
+
         return task.id
     
     def update_task(self, task_id, **kwargs):
@@ -176,15 +322,20 @@ class TaskScheduler:
             return False
         
         task = self.tasks[task_id]
-        
+
+        # 先移除旧索引，属性更新后重建（分组/标签/状态可能变化）
+        self._unindex_task(task)
+
         # 更新任务属性
         for key, value in kwargs.items():
             if hasattr(task, key):
                 setattr(task, key, value)
-        
+
         # 更新时间戳
         task.updated_at = datetime.now()
-        
+        self._index_task(task)
+        self._dirty_ids.add(task.id)
+
         # 如果调度信息更新了，需要重新调度
         if 'schedule' in kwargs or 'enabled' in kwargs:
             # 移除现有的调度
@@ -197,7 +348,7 @@ class TaskScheduler:
         self.logger.info(f"更新任务: {task.name} [{task.id}]")
         
         # 保存任务
-        self.save_tasks()
+        self._request_save()
         
         return True
     
@@ -220,11 +371,14 @@ class TaskScheduler:
         
         # 从字典中删除
         task = self.tasks.pop(task_id)
-        
+        self._unindex_task(task)
+        self._dirty_ids.discard(task_id)
+        self._payload_cache.pop(task_id, None)
+
         self.logger.info(f"删除任务: {task.name} [{task.id}]")
         
         # 保存任务
-        self.save_tasks()
+        self._request_save()
         
         return True
     
@@ -259,7 +413,8 @@ class TaskScheduler:
         返回:
             list: 该分组下的任务列表
         """
-        return [task for task in self.tasks.values() if task.group == group]
+        return [self.tasks[task_id] for task_id in self._by_group.get(group, ())
+                if task_id in self.tasks]
     
     def get_tasks_by_status(self, status):
         """
@@ -273,7 +428,8 @@ class TaskScheduler:
         """
         if isinstance(status, str):
             status = TaskStatus(status)
-        return [task for task in self.tasks.values() if task.status == status]
+        return [self.tasks[task_id] for task_id in self._by_status.get(status, ())
+                if task_id in self.tasks]
     
     def get_tasks_by_tag(self, tag):
         """
@@ -285,7 +441,8 @@ class TaskScheduler:
         返回:
             list: 包含该标签的任务列表
         """
-        return [task for task in self.tasks.values() if tag in task.tags]
+        return [self.tasks[task_id] for task_id in self._by_tag.get(tag, ())
+                if task_id in self.tasks]
     
     def run_task_now(self, task_id):
         """
@@ -310,7 +467,37 @@ class TaskScheduler:
         
         # 执行任务
         self.logger.info(f"手动执行任务: {task.name} [{task.id}]")
-        return self._execute_task(task)
+        result = self._execute_task(task)
+
+        # 手动执行不走调度回调，状态索引和持久化要在这里补上
+        self._reindex_status(task)
+        self._dirty_ids.add(task.id)
+        self._request_save()
+
+        return result
+
+    def cancel_task(self, task_id):
+        """
+        取消正在执行的任务
+
+        参数:
+            task_id (str): 任务ID
+
+        返回:
+            bool: 操作是否成功
+        """
+        if not self.executor.cancel_task(task_id):
+            return False
+
+        # 执行器只改了任务状态，索引和持久化由调度器统一维护
+        task = self.tasks.get(task_id)
+        if task is not None:
+            task.updated_at = datetime.now()
+            self._reindex_status(task)
+            self._dirty_ids.add(task.id)
+            self._request_save()
+
+        return True
     
     def pause_task(self, task_id):
         """
@@ -331,6 +518,8 @@ class TaskScheduler:
         task.status = TaskStatus.PAUSED
         task.enabled = False
         task.updated_at = datetime.now()
+        self._reindex_status(task)
+        self._dirty_ids.add(task.id)
         
         # 移除调度
         self._remove_schedule(task_id)
@@ -338,7 +527,7 @@ class TaskScheduler:
         self.logger.info(f"暂停任务: {task.name} [{task.id}]")
         
         # 保存任务
-        self.save_tasks()
+        self._request_save()
         
         return True
     
@@ -362,6 +551,8 @@ class TaskScheduler:
             task.status = TaskStatus.PENDING
         task.enabled = True
         task.updated_at = datetime.now()
+        self._reindex_status(task)
+        self._dirty_ids.add(task.id)
         
         # 添加调度
         if task.schedule:
@@ -370,7 +561,7 @@ class TaskScheduler:
         self.logger.info(f"恢复任务: {task.name} [{task.id}]")
         
         # 保存任务
-        self.save_tasks()
+        self._request_save()
         
         return True
     
@@ -382,25 +573,21 @@ class TaskScheduler:
             auto_restore_from_backup (bool): 如果加载失败，是否自动从备份恢复
         """
         self.logger.info("加载保存的任务")
-        
-        # 确保目录存在
-        if not os.path.exists(self.data_dir):
-            try:
-                os.makedirs(self.data_dir)
-                self.logger.info(f"创建任务数据目录: {self.data_dir}")
-            except Exception as e:
-                self.logger.error(f"创建任务数据目录失败: {str(e)}")
-            return
-        
-        # 删除临时文件
-        for filename in os.listdir(self.data_dir):
-            if filename.endswith('.tmp'):
-                try:
-                    os.remove(os.path.join(self.data_dir, filename))
-                    self.logger.debug(f"删除临时文件: {filename}")
-                except Exception as e:
-                    self.logger.error(f"删除临时文件 {filename} 失败: {str(e)}")
-        
+
+        # 单次 scandir 完成临时文件清理和旧布局任务文件收集，
+        # DirEntry 缓存了文件名/类型信息，减少重复系统调用
+        file_paths = []
+        with os.scandir(self.data_dir) as it:
+            for entry in it:
+                if entry.name.endswith('.tmp'):
+                    try:
+                        os.unlink(entry.path)
+                        self.logger.debug(f"删除临时文件: {entry.name}")
+                    except Exception as e:
+                        self.logger.error(f"删除临时文件 {entry.name} 失败: {str(e)}")
+                elif entry.name.endswith('.json') and entry.path != self.tasks_file:
+                    file_paths.append(entry.path)
+
         # 清空现有任务
         self.tasks = {}
         
@@ -412,146 +599,279 @@ class TaskScheduler:
             task_classes = {}
             self.logger.error("无法导入任务模块")
         
-        # 遍历任务目录下的所有文件
+        # 统计信息
         successful_loads = 0
         failed_loads = 0
-        
-        for filename in os.listdir(self.data_dir):
-            if not filename.endswith('.json'):
-                continue
 
-            file_path = os.path.join(self.data_dir, filename)
+        if os.path.exists(self.tasks_file):
+            # 统一存储文件布局
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    try:
-                        task_data = json.load(f)
-                    except json.JSONDecodeError as e:
-                        self.logger.error(f"任务文件 {filename} JSON解析失败: {str(e)}")
-                        failed_loads += 1
-                        continue
-
-                # 任务数据完整性检查
-                required_fields = ['id', 'name', 'type', 'created_at', 'updated_at']
-                if not all(field in task_data for field in required_fields):
-                    self.logger.error(f"任务文件 {filename} 缺少必要字段")
-                    failed_loads += 1
-                    continue
-
-                # 导入任务类型
+                with open(self.tasks_file, 'rb') as f:
+                    store = _json_loads(f.read())
+            except Exception as e:
+                self.logger.error(f"加载任务存储文件失败: {str(e)}")
+                store = {}
+                failed_loads += 1
+                # 把损坏的存储文件改名保留（带时间戳避免覆盖更早的
+                # 备份），否则下一次保存会用空任务表覆盖掉还有机会
+                # 人工修复的数据
+                corrupt_path = (f"{self.tasks_file}.corrupt-"
+                                f"{datetime.now().strftime('%Y%m%d_%H%M%S')}")
                 try:
-                    task_type = task_data.get('type', 'BaseTask')
+                    os.replace(self.tasks_file, corrupt_path)
+                    self.logger.error(f"损坏的任务存储文件已移至: {corrupt_path}")
+                except OSError as move_err:
+                    self.logger.error(f"移走损坏的任务存储文件失败: {str(move_err)}")
 
-                    # 先从注册的任务类型中查找
-                    if task_type in task_classes:
-                        task_class = task_classes[task_type]
-                    else:
-                        # 尝试从 src.tasks 模块动态导入
-                        try:
-                            task_module = __import__('src.tasks', fromlist=['tasks'])
-                            if hasattr(task_module, task_type):
-                                task_class = getattr(task_module, task_type)
-                            else:
-                                # 尝试通过模块名导入
-                                module_name = re.sub(r'([a-z])([A-Z])', r'\1_\2', task_type).lower()
-                                task_module = __import__(f'src.tasks.{module_name}', fromlist=[task_type])
-                                task_class = getattr(task_module, task_type)
-                        except (ImportError, AttributeError) as e:
-                            raise ImportError(f"无法导入任务类型 {task_type}: {str(e)}")
-
-                except (ImportError, AttributeError) as e:
-                    self.logger.error(f"导入任务类型 {task_type} 失败: {str(e)}")
+            for task_id, task_data in store.items():
+                if self._load_task_from_data(task_data, task_classes, task_id):
+                    successful_loads += 1
+                else:
                     failed_loads += 1
-                    continue
+        else:
+            # 兼容旧的每任务一个文件的布局，文件列表来自上面的单次扫描
+            # 并行读取+解析小文件，重叠磁盘延迟；任务注册仍在当前线程串行完成
+            if file_paths:
+                max_workers = min(16, (os.cpu_count() or 1) * 4)
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    results = list(pool.map(self._read_task_file, file_paths))
 
-                # 创建任务对象
-                try:
-                    task = task_class.from_dict(task_data)
-                    # 添加到任务字典
-                    self.tasks[task.id] = task
+                for filename, task_data, error in results:
+                    if error is not None:
+                        self.logger.error(error)
+                        failed_loads += 1
+                        continue
 
-                    # 如果任务启用并且有调度表达式，则调度任务
-                    if task.enabled and task.schedule:
-                        try:
-                            self._schedule_task(task)
-                        except Exception as e:
-                            self.logger.warning(f"调度任务 {task.name} [{task.id}] 失败: {str(e)}")
+                    if self._load_task_from_data(task_data, task_classes, filename):
+                        successful_loads += 1
+                    else:
+                        failed_loads += 1
 
-                    self.logger.info(f"加载任务: {task.name} [{task.id}]")
-                    successful_loads += 1
+            # 旧布局的任务在下次保存时统一写入 tasks.json，
+            # 原有的每任务文件在写盘成功后一并清理，避免再次扫描目录
+            self._dirty_ids.update(self.tasks.keys())
+            self._legacy_files = file_paths
 
-                except Exception as e:
-                    self.logger.error(f"从数据创建任务对象失败: {str(e)}")
-                    failed_loads += 1
-                    continue
+        # 任务加载完成后重建反向索引
+        self._rebuild_indexes()
 
-            except Exception as e:
-                self.logger.error(f"加载任务文件 {filename} 失败: {str(e)}")
-                failed_loads += 1
-        
         self.logger.info(f"任务加载完成: 成功 {successful_loads}, 失败 {failed_loads}")
         
         # 自动备份恢复功能已禁用
         # if auto_restore_from_backup and failed_loads > 0 and successful_loads == 0 and os.path.exists(self.backup_dir):
         #     self.logger.warning("所有任务加载失败，尝试从最近备份恢复")
         #     self.restore_tasks_from_backup()
-    
+
+    def _read_task_file(self, file_path):
+        """
+        读取并解析单个任务文件（供并行加载使用）
+
+        参数:
+            file_path (str): 任务文件路径
+
+        返回:
+            tuple: (文件名, 任务数据或None, 错误信息或None)
+        """
+        filename = os.path.basename(file_path)
+        try:
+            with open(file_path, 'rb') as f:
+                try:
+                    task_data = _json_loads(f.read())
+                except ValueError as e:
+                    return filename, None, f"任务文件 {filename} JSON解析失败: {str(e)}"
+            return filename, task_data, None
+        except Exception as e:
+            return filename, None, f"加载任务文件 {filename} 失败: {str(e)}"
+
+    def _load_task_from_data(self, task_data, task_classes, source):
+        """
+        从字典数据创建并注册任务对象
+
+        参数:
+            task_data (dict): 任务的字典表示
+            task_classes (dict): 已注册的任务类型映射
+            source (str): 数据来源（任务ID或文件名），用于日志
+
+        返回:
+            bool: 加载是否成功
+        """
+        # 任务数据完整性检查
+        required_fields = ['id', 'name', 'type', 'created_at', 'updated_at']
+        if not all(field in task_data for field in required_fields):
+            self.logger.error(f"任务数据 {source} 缺少必要字段")
+            return False
+
+        # 导入任务类型：先查注册表，未命中时走全局缓存的解析器
+        task_type = task_data.get('type', 'BaseTask')
+        try:
+            if task_type in task_classes:
+                task_class = task_classes[task_type]
+            else:
+                task_class = _resolve_task_class(task_type)
+        except (ImportError, AttributeError) as e:
+            self.logger.error(f"导入任务类型 {task_type} 失败: {str(e)}")
+            return False
+
+        # 创建任务对象
+        try:
+            task = task_class.from_dict(task_data)
+            # 添加到任务字典
+            self.tasks[task.id] = task
+
+            # 如果任务启用并且有调度表达式，则调度任务
+            if task.enabled and task.schedule:
+                try:
+                    self._schedule_task(task)
+                except Exception as e:
+                    self.logger.warning(f"调度任务 {task.name} [{task.id}] 失败: {str(e)}")
+
+            self.logger.info(f"加载任务: {task.name} [{task.id}]")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"从数据创建任务对象失败: {str(e)}")
+            return False
+
+    def _index_task(self, task):
+        """将任务加入分组/状态/标签/依赖反向索引"""
+        if task.group:
+            self._by_group.setdefault(task.group, set()).add(task.id)
+        self._by_status.setdefault(task.status, set()).add(task.id)
+        self._indexed_status[task.id] = task.status
+        for tag in task.tags:
+            self._by_tag.setdefault(tag, set()).add(task.id)
+        for dep_id in task.dependencies:
+            self._reverse_deps.setdefault(dep_id, set()).add(task.id)
+        self._refresh_dep_state(task)
+
+    def _unindex_task(self, task):
+        """将任务从反向索引中移除"""
+        if task.group:
+            self._by_group.get(task.group, set()).discard(task.id)
+        indexed_status = self._indexed_status.pop(task.id, None)
+        if indexed_status is not None:
+            self._by_status.get(indexed_status, set()).discard(task.id)
+        for tag in task.tags:
+            self._by_tag.get(tag, set()).discard(task.id)
+        for dep_id in task.dependencies:
+            self._reverse_deps.get(dep_id, set()).discard(task.id)
+        self._deps_satisfied.discard(task.id)
+        # 依赖它的任务需要重新评估（被依赖的任务消失即不再满足）
+        self._refresh_dependents(task.id)
+
+    def _reindex_status(self, task):
+        """任务状态变更后同步状态索引"""
+        new_status = task.status
+        old_status = self._indexed_status.get(task.id)
+        if old_status is new_status:
+            return
+        if old_status is not None:
+            self._by_status.get(old_status, set()).discard(task.id)
+        self._by_status.setdefault(new_status, set()).add(task.id)
+        self._indexed_status[task.id] = new_status
+
+        # 进入或离开 SUCCESS 时，只重新评估依赖该任务的下游
+        if new_status == TaskStatus.SUCCESS or old_status == TaskStatus.SUCCESS:
+            self._refresh_dependents(task.id)
+
+    def _refresh_dep_state(self, task):
+        """重新计算单个任务的依赖满足状态"""
+        if all(dep_id in self.tasks and
+               self.tasks[dep_id].status == TaskStatus.SUCCESS
+               for dep_id in task.dependencies):
+            self._deps_satisfied.add(task.id)
+        else:
+            self._deps_satisfied.discard(task.id)
+
+    def _refresh_dependents(self, dep_id):
+        """被依赖任务状态变化后，重新评估其所有下游任务"""
+        for dependent_id in self._reverse_deps.get(dep_id, ()):
+            dependent = self.tasks.get(dependent_id)
+            if dependent is not None:
+                self._refresh_dep_state(dependent)
+
+    def _rebuild_indexes(self):
+        """全量重建反向索引（任务加载完成后调用）"""
+        self._by_group = {}
+        self._by_status = {}
+        self._by_tag = {}
+        self._indexed_status = {}
+        self._reverse_deps = {}
+        self._deps_satisfied = set()
+        for task in self.tasks.values():
+            self._index_task(task)
+
+    def _request_save(self):
+        """请求后台持久化线程保存任务数据（多次请求会被合并）"""
+        self._persist_event.set()
+
+    def _persist_loop(self):
+        """后台持久化循环，合并保存请求后批量落盘"""
+        while not self._persist_stop.is_set():
+            # 有保存请求或超时唤醒检查停止标志
+            if self._persist_event.wait(timeout=5):
+                self._persist_event.clear()
+                if self._persist_stop.is_set():
+                    break
+                try:
+                    self.save_tasks()
+                except Exception as e:
+                    self.logger.error(f"后台保存任务失败: {str(e)}")
+
     def save_tasks(self):
-        """保存所有任务到文件"""
+        """保存所有任务到统一存储文件（多线程调用时串行执行）"""
+        with self._save_lock:
+            self._save_tasks_locked()
+
+    def _save_tasks_locked(self):
+        """保存的实际实现，调用方必须已持有 _save_lock"""
         self.logger.info("保存任务数据")
-        
-        # 确保目录存在
-        if not os.path.exists(self.data_dir):
-            try:
-                os.makedirs(self.data_dir)
-                self.logger.info(f"创建任务数据目录: {self.data_dir}")
-            except Exception as e:
-                self.logger.error(f"创建任务数据目录失败: {str(e)}")
-                return
-        
-        # 如果没有任务，删除所有现有任务文件
-        if not self.tasks:
-            try:
-                for filename in os.listdir(self.data_dir):
-                    if filename.endswith('.json'):
-                        os.remove(os.path.join(self.data_dir, filename))
-                self.logger.info("没有任务，清空任务目录")
-            except Exception as e:
-                self.logger.error(f"清空任务目录失败: {str(e)}")
-            return
-            
-        saved_task_ids = set()
-        for task_id, task in self.tasks.items():
-            try:
-                # 将任务序列化为字典
-                task_data = task.to_dict()
-                
-                # 使用临时文件保存，避免写入时中断导致文件损坏
-                file_path = os.path.join(self.data_dir, f"{task_id}.json")
-                temp_file_path = file_path + ".tmp"
-                
-                with open(temp_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(task_data, f, ensure_ascii=False, indent=2)
-                
-                # 如果写入成功，替换原文件
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                os.rename(temp_file_path, file_path)
-                
-                saved_task_ids.add(task_id)
-                self.logger.debug(f"保存任务: {task.name} [{task.id}]")
-            except Exception as e:
-                self.logger.error(f"保存任务 {task.name} [{task.id}] 失败: {str(e)}")
-        
-        # 删除不存在的任务文件
+
+        # 先把脏集合整体换成新的空集合：保存期间其他线程新增的脏标
+        # 记落在新集合里，留待下一次保存处理。落盘后再 clear() 会把
+        # 这些并发标记一起抹掉，对应任务的新状态就永远进不了磁盘
+        dirty, self._dirty_ids = self._dirty_ids, set()
+
         try:
-            for filename in os.listdir(self.data_dir):
-                if filename.endswith('.json'):
-                    file_id = filename.split('.')[0]
-                    if file_id not in saved_task_ids:
-                        os.remove(os.path.join(self.data_dir, filename))
-                        self.logger.debug(f"删除不存在的任务文件: {filename}")
+            # 脏任务重新执行 to_dict()，未变更的任务直接复用上次的
+            # 序列化结果；list() 先对任务表做原子快照，遍历期间其他
+            # 线程的增删不会打断迭代
+            payload = {}
+            for task_id, task in list(self.tasks.items()):
+                try:
+                    cached = self._payload_cache.get(task_id)
+                    if cached is None or task_id in dirty:
+                        cached = task.to_dict()
+                        self._payload_cache[task_id] = cached
+                    payload[task_id] = cached
+                except Exception as e:
+                    self.logger.error(f"序列化任务 {task.name} [{task.id}] 失败: {str(e)}")
+                    # 序列化失败的任务保持脏标记，下次保存重试
+                    self._dirty_ids.add(task_id)
+
+            # 使用临时文件保存，避免写入时中断导致文件损坏
+            temp_file_path = self.tasks_file + ".tmp"
+            with open(temp_file_path, 'wb') as f:
+                f.write(_json_dumps(payload))
+
+            # 如果写入成功，原子替换原文件（免去先 remove 再 rename 的两次调用）
+            os.replace(temp_file_path, self.tasks_file)
+
+            self.logger.debug(f"保存 {len(payload)} 个任务到 {self.tasks_file}")
+
+            # 统一存储已落盘，清理旧布局遗留的每任务文件（仅首次保存后执行一次）
+            if self._legacy_files:
+                for file_path in self._legacy_files:
+                    try:
+                        os.remove(file_path)
+                    except OSError:
+                        pass
+                self.logger.info(f"已清理 {len(self._legacy_files)} 个旧布局任务文件")
+                self._legacy_files = []
         except Exception as e:
-            self.logger.error(f"清理过期任务文件失败: {str(e)}")
+            # 保存没有落盘，归还取走的脏标记，下次保存重新序列化
+            self._dirty_ids |= dirty
+            self.logger.error(f"保存任务数据失败: {str(e)}")
     
     def _schedule_task(self, task):
         """
@@ -561,52 +881,16 @@ class TaskScheduler:
             task (BaseTask): 要调度的任务
         """
         try:
-            # 解析调度表达式
-            if task.schedule.startswith('cron:'):
-                # Cron 表达式
-                cron_expr = task.schedule[5:]
-                trigger = CronTrigger.from_crontab(cron_expr)
-                
-                # 计算下次运行时间
-                cron = croniter(cron_expr, datetime.now())
-                task.next_run = cron.get_next(datetime)
-                
-            elif task.schedule.startswith('interval:'):
-                # 间隔表达式，格式为 interval:n(s|m|h|d)
-                interval_expr = task.schedule[9:]
-                interval_value = int(interval_expr[:-1])
-                interval_unit = interval_expr[-1]
-                
-                # 根据单位转换为秒
-                if interval_unit == 's':
-                    seconds = interval_value
-                elif interval_unit == 'm':
-                    seconds = interval_value * 60
-                elif interval_unit == 'h':
-                    seconds = interval_value * 3600
-                elif interval_unit == 'd':
-                    seconds = interval_value * 86400
-                else:
-                    raise ValueError(f"不支持的间隔单位: {interval_unit}")
-                
-                trigger = IntervalTrigger(seconds=seconds)
-                
-                # 计算下次运行时间
-                task.next_run = datetime.now() + timedelta(seconds=seconds)
-                
-            elif task.schedule.startswith('date:'):
-                # 指定日期时间，格式为 date:YYYY-MM-DD HH:MM:SS
-                date_str = task.schedule[5:]
-                run_date = datetime.fromisoformat(date_str)
-                trigger = DateTrigger(run_date=run_date)
-                
-                # 设置下次运行时间
-                task.next_run = run_date
-                
-            else:
+            # 按前缀分发到对应解析函数，解析结果缓存在任务上供每次触发复用
+            kind, _, expr = task.schedule.partition(':')
+            handler = _SCHED_HANDLERS.get(kind)
+            if handler is None:
                 self.logger.error(f"不支持的调度表达式: {task.schedule}")
                 return
-            
+
+            trigger, task.next_run, task._parsed_schedule = handler(expr)
+
+
             # 添加到调度器
             self.scheduler.add_job(
                 self._run_scheduled_task,
@@ -620,12 +904,33 @@ class TaskScheduler:
             # 更新任务状态
             task.status = TaskStatus.SCHEDULED
             task.updated_at = datetime.now()
+            self._reindex_status(task)
             
             self.logger.info(f"调度任务: {task.name} [{task.id}], 下次执行: {task.next_run}")
             
         except Exception as e:
             self.logger.error(f"调度任务 {task.name} [{task.id}] 失败: {str(e)}")
     
+    def _schedule_delayed_run(self, task_id, delay_seconds, reason):
+        """
+        通过调度器提交一次延迟执行，替代一次性的 Timer 线程
+
+        参数:
+            task_id (str): 任务ID
+            delay_seconds (int): 延迟秒数
+            reason (str): 延迟原因，用于生成去重的作业ID
+        """
+        try:
+            self.scheduler.add_job(
+                self._run_scheduled_task,
+                trigger=DateTrigger(run_date=datetime.now() + timedelta(seconds=delay_seconds)),
+                args=[task_id],
+                id=f"{task_id}:{reason}",
+                replace_existing=True
+            )
+        except Exception as e:
+            self.logger.error(f"提交延迟任务 {task_id} 失败: {str(e)}")
+
     def _remove_schedule(self, task_id):
         """
         移除任务调度
@@ -658,16 +963,14 @@ class TaskScheduler:
             self.logger.warning(f"任务 {task.name} [{task.id}] 的依赖任务未完成，跳过执行")
             return
         
-        # 检查是否达到最大并发数
-        with self.task_lock:
-            if len(self.running_tasks) >= self.max_concurrent_tasks:
-                self.logger.warning(f"达到最大并发任务数，延迟执行任务: {task.name} [{task.id}]")
-                
-                # 稍后重试
-                retry_seconds = 30
-                threading.Timer(retry_seconds, self._run_scheduled_task, [task_id]).start()
-                return
-        
+        # 通过信号量获取并发容量，失败即达到上限
+        if not self._capacity.acquire(blocking=False):
+            self.logger.warning(f"达到最大并发任务数，延迟执行任务: {task.name} [{task.id}]")
+
+            # 稍后重试，复用调度器的延迟任务而不是新建 Timer 线程
+            self._schedule_delayed_run(task_id, 30, 'backpressure')
+            return
+
         # 执行任务
         self.logger.info(f"执行调度任务: {task.name} [{task.id}]")
         
@@ -679,29 +982,15 @@ class TaskScheduler:
         thread.daemon = True
         thread.start()
         
-        # 更新下次执行时间
-        if task.schedule and task.schedule.startswith('cron:'):
-            cron_expr = task.schedule[5:]
-            cron = croniter(cron_expr, datetime.now())
-            task.next_run = cron.get_next(datetime)
-        elif task.schedule and task.schedule.startswith('interval:'):
-            interval_expr = task.schedule[9:]
-            interval_value = int(interval_expr[:-1])
-            interval_unit = interval_expr[-1]
-            
-            # 根据单位转换为秒
-            if interval_unit == 's':
-                seconds = interval_value
-            elif interval_unit == 'm':
-                seconds = interval_value * 60
-            elif interval_unit == 'h':
-                seconds = interval_value * 3600
-            elif interval_unit == 'd':
-                seconds = interval_value * 86400
-            else:
-                seconds = 3600  # 默认1小时
-            
-            task.next_run = datetime.now() + timedelta(seconds=seconds)
+        # 更新下次执行时间，复用调度时缓存的解析结果
+        parsed = getattr(task, '_parsed_schedule', None)
+        if parsed is not None:
+            kind, payload = parsed
+            if kind == 'cron':
+                # 长期复用的 croniter 实例，直接推进到下一次触发
+                task.next_run = payload.get_next(datetime)
+            elif kind == 'interval':
+                task.next_run = datetime.now() + timedelta(seconds=payload)
     
     def _execute_task(self, task):
         """
@@ -713,18 +1002,16 @@ class TaskScheduler:
         返回:
             TaskResult: 任务执行结果
         """
-        # 添加到运行中的任务
-        with self.task_lock:
-            self.running_tasks[task.id] = task
-        
+        # 添加到运行中的任务，单键写入/删除由 GIL 保证原子性，无需加锁
+        self.running_tasks[task.id] = task
+
         # 执行任务
-        result = self.executor.execute(task)
-        
-        # 从运行中的任务移除
-        with self.task_lock:
-            if task.id in self.running_tasks:
-                del self.running_tasks[task.id]
-        
+        try:
+            result = self.executor.execute(task)
+        finally:
+            # 从运行中的任务移除
+            self.running_tasks.pop(task.id, None)
+
         return result
     
     def _execute_task_and_handle_result(self, task):
@@ -734,8 +1021,12 @@ class TaskScheduler:
         参数:
             task (BaseTask): 要执行的任务
         """
-        result = self._execute_task(task)
-        
+        try:
+            result = self._execute_task(task)
+        finally:
+            # 归还并发容量（只有调度路径获取过信号量）
+            self._capacity.release()
+
         # 处理执行结果
         if result.status == TaskStatus.FAILED:
             # 处理任务失败，考虑重试
@@ -744,9 +1035,9 @@ class TaskScheduler:
                 task.retries += 1
                 self.logger.info(f"任务 {task.name} [{task.id}] 失败，将在 {task.retry_interval} 秒后重试 "
                                  f"({task.retries}/{task.max_retries})")
-                
-                # 延迟重试
-                threading.Timer(task.retry_interval, self._run_scheduled_task, [task.id]).start()
+
+                # 延迟重试，复用调度器的延迟任务而不是新建 Timer 线程
+                self._schedule_delayed_run(task.id, task.retry_interval, f'retry-{task.retries}')
             else:
                 # 达到最大重试次数，发送通知
                 self.logger.warning(f"任务 {task.name} [{task.id}] 达到最大重试次数，不再重试")
@@ -778,8 +1069,15 @@ class TaskScheduler:
                 f"任务 {task.name} 执行超时，超过了 {task.timeout} 秒。"
             )
         
-        # 保存任务状态
-        self.save_tasks()
+        # 任务执行过程中状态已变化，同步状态索引
+        self._reindex_status(task)
+
+        # 保存任务状态：重试中的瞬态走合并保存，终态同步落盘
+        self._dirty_ids.add(task.id)
+        if result.status == TaskStatus.FAILED and 0 < task.retries <= task.max_retries:
+            self._request_save()
+        else:
+            self.save_tasks()
     
     def _check_dependencies(self, task):
         """
@@ -791,19 +1089,8 @@ class TaskScheduler:
         返回:
             bool: 是否所有依赖任务都已完成
         """
-        if not task.dependencies:
-            return True
-        
-        for dep_id in task.dependencies:
-            if dep_id not in self.tasks:
-                self.logger.warning(f"任务 {task.name} [{task.id}] 依赖不存在的任务: {dep_id}")
-                return False
-            
-            dep_task = self.tasks[dep_id]
-            if dep_task.status != TaskStatus.SUCCESS:
-                return False
-        
-        return True
+        # 依赖满足状态由索引增量维护，这里只做一次集合成员判断
+        return not task.dependencies or task.id in self._deps_satisfied
     
     def _job_event_listener(self, event):
         """
@@ -820,7 +1107,9 @@ class TaskScheduler:
                 task = self.tasks[event.job_id]
                 task.status = TaskStatus.FAILED
                 task.updated_at = datetime.now()
-                
+                self._reindex_status(task)
+                self._dirty_ids.add(task.id)
+
                 # 发送通知
                 self.notifier.send_task_notification(
                     task,
@@ -834,7 +1123,9 @@ class TaskScheduler:
             if event.job_id in self.tasks:
                 task = self.tasks[event.job_id]
                 task.status = TaskStatus.PENDING
-                task.updated_at = datetime.now() 
+                task.updated_at = datetime.now()
+                self._reindex_status(task)
+                self._dirty_ids.add(task.id)
     
     def backup_tasks(self):
         """备份所有任务 (已禁用)"""
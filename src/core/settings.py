@@ -8,12 +8,116 @@
 """
 
 import os
+import hashlib
 import logging
-import configparser
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 
+from src.core.fast_ini import FastIni
 from src.utils.path_utils import get_app_data_dir
 
+# 布尔真值集合：frozenset 查找快于元组线性扫描
+_BOOL_TRUE = frozenset(('true', 'yes', 'y', '1'))
+
+
+def _to_bool(value):
+    """配置字符串转布尔值"""
+    return value.lower() in _BOOL_TRUE
+
+
+def _to_list(value):
+    """逗号分隔的配置字符串转列表"""
+    return [item.strip() for item in value.split(',')]
+
+
+# 类型到转换函数的分发表，取代逐类型的 if/elif 级联
+_CONVERTERS = {bool: _to_bool, int: int, float: float, list: _to_list}
+
+# 区分"缓存了None"和"未缓存"的哨兵值
+_SENTINEL = object()
+
+# 默认配置，和真实配置走同一条解析路径，整体可读可审
+_DEFAULT_INI = """\
+[General]
+version = 1.0.0
+auto_start = false
+minimize_to_tray = false
+theme = light
+
+[Scheduler]
+check_interval = 10
+default_timeout = 3600
+max_concurrent_tasks = 5
+max_retries = 3
+retry_interval = 60
+
+[Logging]
+level = INFO
+retention_days = 30
+verbose = true
+
+[Notification]
+enable = true
+type = desktop
+smtp_server = smtp.example.com
+smtp_port = 587
+smtp_user = user@example.com
+smtp_password =
+email_recipient =
+email_subject_prefix = [Win-Task]
+
+[Security]
+encrypt_sensitive_data = true
+backup_frequency = 7
+max_backups = 10
+"""
+
+# 配置项类型模式：(节, 键) -> (类型, 默认值)
+# load() 时按此模式一次性完成类型转换，属性读取只做一次字典查找
+_SCHEMA = {
+    ('General', 'version'): (str, '1.0.0'),
+    ('General', 'auto_start'): (bool, False),
+    ('General', 'minimize_to_tray'): (bool, False),
+    ('General', 'theme'): (str, 'light'),
+    ('Scheduler', 'check_interval'): (int, 10),
+    ('Scheduler', 'default_timeout'): (int, 3600),
+    ('Scheduler', 'max_concurrent_tasks'): (int, 5),
+    ('Scheduler', 'max_retries'): (int, 3),
+    ('Scheduler', 'retry_interval'): (int, 60),
+    ('Logging', 'level'): (str, 'INFO'),
+    ('Logging', 'retention_days'): (int, 30),
+    ('Logging', 'verbose'): (bool, True),
+    ('Notification', 'enable'): (bool, True),
+    ('Notification', 'type'): (str, 'desktop'),
+    ('Notification', 'smtp_server'): (str, 'smtp.example.com'),
+    ('Notification', 'smtp_port'): (int, 587),
+    ('Notification', 'smtp_user'): (str, ''),
+    ('Notification', 'smtp_password'): (str, ''),
+    ('Notification', 'email_recipient'): (str, ''),
+    ('Notification', 'email_subject_prefix'): (str, '[Win-Task]'),
+    ('Security', 'encrypt_sensitive_data'): (bool, True),
+    ('Security', 'backup_frequency'): (int, 7),
+    ('Security', 'max_backups'): (int, 10),
+}
+
+
+@dataclass(frozen=True)
+class SchedulerConfig:
+    """
+    调度器相关配置的不可变快照
+
+    热循环中反复读取配置时直接访问冻结数据类的属性，
+    避免每次都走配置节/键查找路径。配置变更后重新取快照即可。
+    """
+    check_interval: int
+    default_timeout: int
+    max_concurrent_tasks: int
+    max_retries: int
+    retry_interval: int
+
+
 class Settings:
     """设置管理器类"""
     
@@ -32,15 +136,31 @@ class Settings:
             config_file = os.path.join(app_data_dir, 'config.ini')
         
         self.config_file = config_file
-        self.config = configparser.ConfigParser()
+
+        # 配置文件只有简单的 key = value 布局，轻量解析器足够且更快
+        self.config = FastIni()
+
+        # 已完成类型转换的配置缓存，(节, 键) -> 值
+        self._typed = {}
+
+        # 延迟加载标记：配置文件在首次访问时才解析，不占用启动路径
+        self._loaded = False
+        self._loaded_mtime = None
+
+        # 上次写盘内容的摘要，内容未变化时跳过写入
+        self._last_digest = None
+
+        # 保存去抖状态：短时间内的多次 set() 合并为一次落盘
+        self._dirty = False
+        self._batch_depth = 0
+        self._flush_timer = None
+        self._flush_lock = threading.Lock()
         
         # 确保配置文件所在目录存在
         config_dir = os.path.dirname(self.config_file)
         if not os.path.exists(config_dir):
             os.makedirs(config_dir)
         
-        # 加载配置
-        self.load()
         self.logger.info(f"设置管理器初始化完成，配置文件: {config_file}")
     
     def load(self):
@@ -55,12 +175,60 @@ class Settings:
         else:
             self.logger.warning("配置文件不存在，创建默认配置")
             self._create_default_config()
-    
+
+        # 按模式一次性完成类型转换，之后的属性读取只查缓存
+        self._build_typed_cache()
+
+        self._loaded = True
+
+        # 记录加载时的文件修改时间，后续 save() 无需重新加载
+        try:
+            self._loaded_mtime = os.path.getmtime(self.config_file)
+        except OSError:
+            self._loaded_mtime = None
+
+    def _ensure_loaded(self):
+        """确保配置已加载（首次访问时才解析文件）"""
+        if not self._loaded:
+            self.load()
+
+    def _build_typed_cache(self):
+        """按类型模式把配置值预先转换并缓存"""
+        for (section, key), (type_, default) in _SCHEMA.items():
+            if section in self.config and key in self.config[section]:
+                self._typed[(section, key)] = self._convert(
+                    self.config[section][key], type_, default)
+            else:
+                self._typed[(section, key)] = default
+
+    def _convert(self, value, type_, default):
+        """将配置字符串转换为目标类型，失败时返回默认值"""
+        converter = _CONVERTERS.get(type_)
+        if converter is None:
+            return value
+
+        try:
+            return converter(value)
+        except (ValueError, AttributeError):
+            return default
+
     def save(self):
         """保存配置到文件"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                self.config.write(f)
+            content = self.config.dumps()
+
+            # 内容与上次写盘一致时直接跳过，不触碰磁盘
+            digest = hashlib.blake2b(content.encode('utf-8')).digest()
+            if digest == self._last_digest:
+                return True
+
+            # 先写临时文件再原子替换，写入中断不会截断原配置
+            temp_path = self.config_file + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            os.replace(temp_path, self.config_file)
+
+            self._last_digest = digest
             self.logger.info("配置保存成功")
             return True
         except Exception as e:
@@ -80,28 +248,20 @@ class Settings:
         返回:
             配置项的值，经过类型转换
         """
+        self._ensure_loaded()
+
+        # 已知配置项直接命中类型缓存，无需每次重新转换
+        cached = self._typed.get((section, key), _SENTINEL)
+        if cached is not _SENTINEL:
+            return cached
+
+        # 只在取值一步捕获缺失，转换错误由 _convert 收窄处理
         try:
-            if section not in self.config:
-                return default
-            
-            if key not in self.config[section]:
-                return default
-            
             value = self.config[section][key]
-            
-            if type_ == bool:
-                return value.lower() in ('true', 'yes', 'y', '1')
-            elif type_ == int:
-                return int(value)
-            elif type_ == float:
-                return float(value)
-            elif type_ == list:
-                return [item.strip() for item in value.split(',')]
-            else:
-                return value
-        except Exception as e:
-            self.logger.error(f"获取配置项 [{section}]{key} 失败: {str(e)}")
+        except KeyError:
             return default
+
+        return self._convert(value, type_, default)
     
     def set(self, section, key, value):
         """
@@ -115,6 +275,8 @@ class Settings:
         返回:
             bool: 操作是否成功
         """
+        self._ensure_loaded()
+
         try:
             # 确保section存在
             if section not in self.config:
@@ -128,15 +290,67 @@ class Settings:
             else:
                 str_value = str(value)
             
-            # 设置值
+            # 设置值，同步刷新类型缓存避免读到旧值
             self.config[section][key] = str_value
-            
-            # 保存配置
-            return self.save()
+            cache_key = (section, key)
+            if cache_key in _SCHEMA:
+                type_, default = _SCHEMA[cache_key]
+                self._typed[cache_key] = self._convert(str_value, type_, default)
+
+            # 请求保存（短时间内的多次修改合并为一次写盘）
+            return self._schedule_save()
         except Exception as e:
             self.logger.error(f"设置配置项 [{section}]{key} 失败: {str(e)}")
             return False
-    
+
+    def _schedule_save(self):
+        """
+        标记配置已变更并安排延迟保存
+
+        批量修改期间只标记不落盘；否则启动一个短暂的去抖定时器，
+        把 UI 连续勾选等密集修改合并为一次完整写入。
+
+        返回:
+            bool: 操作是否成功
+        """
+        self._dirty = True
+
+        if self._batch_depth > 0:
+            return True
+
+        with self._flush_lock:
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(0.2, self._flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+        return True
+
+    def _flush(self):
+        """把挂起的配置变更写入磁盘"""
+        with self._flush_lock:
+            self._flush_timer = None
+
+        if self._dirty:
+            self._dirty = False
+            self.save()
+
+    @contextmanager
+    def batch(self):
+        """
+        批量修改上下文管理器
+
+        with settings.batch(): 期间的 set() 调用不会触发保存，
+        退出时一次性落盘。
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush()
+
     def get_sections(self):
         """
         获取所有配置节
@@ -144,6 +358,7 @@ class Settings:
         返回:
             list: 所有配置节的列表
         """
+        self._ensure_loaded()
         return list(self.config.sections())
     
     def get_options(self, section):
@@ -156,6 +371,7 @@ class Settings:
         返回:
             list: 配置项名称列表，如果节不存在则返回空列表
         """
+        self._ensure_loaded()
         if section in self.config:
             return list(self.config[section].keys())
         return []
@@ -170,53 +386,35 @@ class Settings:
         返回:
             dict: 配置项的字典，如果节不存在则返回空字典
         """
+        self._ensure_loaded()
         if section in self.config:
             return dict(self.config[section])
         return {}
     
     def _create_default_config(self):
         """创建默认配置"""
-        self.config['General'] = {
-            'version': '1.0.0',
-            'auto_start': 'false',
-            'minimize_to_tray': 'false',
-            'theme': 'light'
-        }
-        
-        self.config['Scheduler'] = {
-            'check_interval': '10',
-            'default_timeout': '3600',
-            'max_concurrent_tasks': '5',
-            'max_retries': '3',
-            'retry_interval': '60'
-        }
-        
-        self.config['Logging'] = {
-            'level': 'INFO',
-            'retention_days': '30',
-            'verbose': 'true'
-        }
-        
-        self.config['Notification'] = {
-            'enable': 'true',
-            'type': 'desktop',
-            'smtp_server': 'smtp.example.com',
-            'smtp_port': '587',
-            'smtp_user': 'user@example.com',
-            'smtp_password': '',
-            'email_recipient': '',
-            'email_subject_prefix': '[Win-Task]'
-        }
-        
-        self.config['Security'] = {
-            'encrypt_sensitive_data': 'true',
-            'backup_frequency': '7',
-            'max_backups': '10'
-        }
-        
+        # 默认值与真实配置共用同一条解析路径，免去逐节逐键赋值
+        self.config.read_string(_DEFAULT_INI)
+
         # 保存默认配置
         self.save()
     
+    def scheduler_snapshot(self):
+        """
+        获取调度器相关配置的快照
+
+        返回:
+            SchedulerConfig: 冻结的配置快照
+        """
+        self._ensure_loaded()
+        return SchedulerConfig(
+            check_interval=self._typed[('Scheduler', 'check_interval')],
+            default_timeout=self._typed[('Scheduler', 'default_timeout')],
+            max_concurrent_tasks=self._typed[('Scheduler', 'max_concurrent_tasks')],
+            max_retries=self._typed[('Scheduler', 'max_retries')],
+            retry_interval=self._typed[('Scheduler', 'retry_interval')],
+        )
+
     @property
     def version(self):
         """获取应用版本"""
@@ -10,6 +10,8 @@
 import time
 import uuid
 import logging
+import threading
+from collections import deque
 from enum import Enum
 from datetime import datetime
 from abc import ABC, abstractmethod
@@ -35,9 +37,27 @@ class TaskPriority(Enum):
     CRITICAL = 3
 
 
+# 值到枚举成员的反查表：批量反序列化时字典查找远快于枚举的 __call__ 机制
+_STATUS_BY_VALUE = {s.value: s for s in TaskStatus}
+_PRIORITY_BY_VALUE = {p.value: p for p in TaskPriority}
+
+
+# 反序列化时的线程本地标记：from_dict 会立即覆盖 id 和时间戳，
+# 构造函数据此跳过 uuid4 和 datetime.now() 调用
+_init_state = threading.local()
+
+# 任务类型注册表：BaseTask 子类在定义时自动登记，
+# 免去 pkgutil/inspect 的运行时扫描
+TASK_REGISTRY = {}
+
+
 class TaskResult:
     """任务执行结果"""
-    
+
+    # 固定属性集合，省去每实例 __dict__ 的内存和查找开销
+    __slots__ = ('start_time', 'end_time', 'status', 'return_code',
+                 'output', 'error', 'execution_time')
+
     def __init__(self):
         self.start_time = None        # 开始时间
         self.end_time = None          # 结束时间
@@ -79,7 +99,25 @@ class TaskResult:
 
 class BaseTask(ABC):
     """任务基类"""
-    
+
+    # 固定属性集合：任务实例数量大，省去 __dict__ 可节省约一半内存。
+    # 未声明 __slots__ 的子类自动带 __dict__，其特有属性不受影响。
+    # _parsed_schedule 是调度器缓存的调度表达式解析结果，__weakref__
+    # 支持调度器的弱引用运行索引
+    __slots__ = ('id', 'name', 'description', 'status', 'priority',
+                 'schedule', 'timeout', 'group', 'tags', 'retries',
+                 'max_retries', 'retry_interval', 'dependencies',
+                 'created_at', 'updated_at', 'last_run', 'next_run',
+                 'history', 'enabled', '_parsed_schedule', '__weakref__')
+
+    # 记录器挂在类上：每个子类定义时解析一次，实例创建零额外开销
+    logger = logging.getLogger("task.BaseTask")
+
+    def __init_subclass__(cls, **kwargs):
+        cls.logger = logging.getLogger(f"task.{cls.__name__}")
+        TASK_REGISTRY[cls.__name__] = cls
+        super().__init_subclass__(**kwargs)
+
     def __init__(self, name, description=""):
         """
         初始化任务
@@ -88,7 +126,14 @@ class BaseTask(ABC):
             name (str): 任务名称
             description (str, optional): 任务描述
         """
-        self.id = str(uuid.uuid4())               # 任务唯一ID
+        # 反序列化路径跳过默认ID和时间戳生成，这些字段随后会被覆盖
+        if getattr(_init_state, 'fast', False):
+            self.id = None
+            now = None
+        else:
+            self.id = str(uuid.uuid4())           # 任务唯一ID
+            now = datetime.now()
+
         self.name = name                          # 任务名称
         self.description = description            # 任务描述
         self.status = TaskStatus.PENDING          # 任务状态
@@ -101,15 +146,13 @@ class BaseTask(ABC):
         self.max_retries = 0                      # 最大重试次数
         self.retry_interval = 60                  # 重试间隔(秒)
         self.dependencies = []                    # 依赖任务ID列表
-        self.created_at = datetime.now()          # 创建时间
-        self.updated_at = datetime.now()          # 更新时间
+        self.created_at = now                     # 创建时间
+        self.updated_at = now                     # 更新时间
         self.last_run = None                      # 上次运行时间
         self.next_run = None                      # 下次运行时间
-        self.history = []                         # 执行历史记录
+        self.history = deque(maxlen=50)           # 执行历史记录，满50条自动丢弃最旧的
         self.enabled = True                       # 是否启用
-        
-        self.logger = logging.getLogger(f"task.{self.__class__.__name__}")
-    
+
     @abstractmethod
     def run(self):
         """
@@ -140,17 +183,36 @@ class BaseTask(ABC):
         self.logger.info(f"开始执行任务 {self.name} [{self.id}]")
         
         try:
-            # 设置超时处理
+            timed_out = False
+            task_result = None
+
             if self.timeout > 0:
-                # 这里可以使用signal或线程实现超时控制
-                # 简单实现
-                start_time = time.time()
-            
-            # 执行任务实现
-            task_result = self.run()
-            
-            # 检查超时
-            if self.timeout > 0 and time.time() - start_time > self.timeout:
+                # 专用守护线程承载运行：超时后线程被弃置，不占用任何
+                # 共享容量（挂死的任务不会饿死后续的超时任务），守护
+                # 属性保证它也不会阻止解释器退出
+                outcome = []
+
+                def _invoke():
+                    try:
+                        outcome.append((True, self.run()))
+                    except BaseException as e:
+                        outcome.append((False, e))
+
+                worker = threading.Thread(
+                    target=_invoke, daemon=True, name=f'task-run-{self.name}')
+                worker.start()
+                worker.join(self.timeout)
+                if worker.is_alive() or not outcome:
+                    timed_out = True
+                elif not outcome[0][0]:
+                    raise outcome[0][1]
+                else:
+                    task_result = outcome[0][1]
+            else:
+                # 无超时要求时直接执行，快乐路径零额外开销
+                task_result = self.run()
+
+            if timed_out:
                 result.complete(TaskStatus.TIMEOUT, -1, "", "任务执行超时")
                 self.logger.warning(f"任务 {self.name} [{self.id}] 执行超时")
             else:
@@ -160,9 +222,9 @@ class BaseTask(ABC):
                 else:
                     # 如果子类没有返回TaskResult对象，则包装结果
                     result.complete(TaskStatus.SUCCESS, 0, str(task_result))
-                
+
                 self.logger.info(f"任务 {self.name} [{self.id}] 执行完成: {result}")
-        
+
         except Exception as e:
             # 捕获异常并记录
             error_msg = f"任务执行异常: {str(e)}"
@@ -173,21 +235,19 @@ class BaseTask(ABC):
         self.status = result.status
         self.updated_at = datetime.now()
         
-        # 添加到执行历史
+        # 添加到执行历史（时间在写入时即转为ISO字符串；
+        # 状态保留枚举单例，不在热路径上分配字符串）
         execution_record = {
-            'time': result.start_time,
-            'status': result.status.value,
+            'time': result.start_time.isoformat() if result.start_time else None,
+            'status': result.status,
             'execution_time': result.execution_time,
             'return_code': result.return_code,
             'output': result.output,
             'error': result.error
         }
+        # deque(maxlen=50) 追加时自动淘汰最旧记录，无需切片重建
         self.history.append(execution_record)
-        
-        # 只保留最近的50条历史记录
-        if len(self.history) > 50:
-            self.history = self.history[-50:]
-        
+
         return result
     
     def to_dict(self):
@@ -197,19 +257,19 @@ class BaseTask(ABC):
         返回:
             dict: 任务的字典表示
         """
-        # 处理历史记录中的datetime对象
-        processed_history = []
-        for record in self.history:
-            processed_record = record.copy()
-            if 'time' in processed_record and isinstance(processed_record['time'], datetime):
-                processed_record['time'] = processed_record['time'].isoformat()
-            processed_history.append(processed_record)
-            
+        # 历史记录中的时间已是ISO字符串；状态枚举只在序列化边界转为
+        # 枚举名（ASCII、不受界面文案调整影响）
+        history = [
+            {**record, 'status': record['status'].name}
+            if isinstance(record.get('status'), TaskStatus) else record
+            for record in self.history
+        ]
+
         return {
             'id': self.id,
             'name': self.name,
             'description': self.description,
-            'status': self.status.value,
+            'status': self.status.name,
             'priority': self.priority.value,
             'schedule': self.schedule,
             'timeout': self.timeout,
@@ -223,7 +283,7 @@ class BaseTask(ABC):
             'updated_at': self.updated_at.isoformat(),
             'last_run': self.last_run.isoformat() if self.last_run else None,
             'next_run': self.next_run.isoformat() if self.next_run else None,
-            'history': processed_history,
+            'history': history,
             'enabled': self.enabled,
             'type': self.__class__.__name__
         }
@@ -239,10 +299,18 @@ class BaseTask(ABC):
         返回:
             BaseTask: 任务对象
         """
-        task = cls(data['name'], data.get('description', ''))
+        # 构造时跳过 uuid4/now 默认值生成，下面会全部从数据赋值
+        _init_state.fast = True
+        try:
+            task = cls(data['name'], data.get('description', ''))
+        finally:
+            _init_state.fast = False
+
         task.id = data['id']
-        task.status = TaskStatus(data['status'])
-        task.priority = TaskPriority(data['priority'])
+        # 新格式持久化枚举名（纯字典查找）；旧文件存的是值字符串，兼容回退
+        status = data['status']
+        task.status = TaskStatus.__members__.get(status) or _STATUS_BY_VALUE[status]
+        task.priority = _PRIORITY_BY_VALUE[data['priority']]
         task.schedule = data['schedule']
         task.timeout = data['timeout']
         task.group = data['group']
@@ -259,18 +327,14 @@ class BaseTask(ABC):
         if data['next_run']:
             task.next_run = datetime.fromisoformat(data['next_run'])
             
-        # 处理历史记录
-        task.history = []
-        for record in data.get('history', []):
-            processed_record = record.copy()
-            if 'time' in processed_record and isinstance(processed_record['time'], str):
-                try:
-                    processed_record['time'] = datetime.fromisoformat(processed_record['time'])
-                except (ValueError, TypeError):
-                    # 如果解析失败，保留字符串格式
-                    pass
-            task.history.append(processed_record)
-            
+        # 历史记录的时间统一保留ISO字符串；状态枚举名还原为枚举成员，
+        # 旧格式的值字符串原样保留（界面两种形式都能处理）
+        task.history = deque(
+            ({**record, 'status': TaskStatus.__members__[record['status']]}
+             if record.get('status') in TaskStatus.__members__ else record
+             for record in data.get('history', [])),
+            maxlen=50)
+
         task.enabled = data.get('enabled', True)
         
         return task
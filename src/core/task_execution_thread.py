@@ -4,24 +4,31 @@
 """
 任务执行线程模块
 
-提供后台执行任务的线程类
+提供后台执行任务的可运行对象，由全局 QThreadPool 复用线程执行，
+避免每次任务触发都创建和销毁一个 OS 线程
 """
 
 import logging
-from PyQt5.QtCore import QThread, pyqtSignal
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 
+# 模块级记录器，避免每个线程实例重复走 getLogger 的管理器锁
+_LOGGER = logging.getLogger("task_thread")
+
+
+class TaskSignals(QObject):
+    """任务执行信号载体（QRunnable 本身不能定义信号）"""
 
-class TaskExecutionThread(QThread):
-    """任务执行线程类"""
-    
-    # 定义信号
     taskFinished = pyqtSignal(object)  # 任务完成信号，参数为任务结果
     taskError = pyqtSignal(str)        # 任务错误信号，参数为错误消息
-    
+
+
+class TaskRunnable(QRunnable):
+    """任务执行可运行对象，提交到共享 QThreadPool 执行"""
+
     def __init__(self, scheduler, task_id):
         """
-        初始化任务执行线程
-        
+        初始化任务执行对象
+
         参数:
             scheduler: 任务调度器
             task_id: 要执行的任务ID
@@ -29,25 +36,30 @@ class TaskExecutionThread(QThread):
         super().__init__()
         self.scheduler = scheduler
         self.task_id = task_id
-        self.logger = logging.getLogger("task_thread")
-    
+        self.signals = TaskSignals()
+        self.logger = _LOGGER
+
+    def start(self):
+        """提交到全局线程池执行"""
+        QThreadPool.globalInstance().start(self)
+
     def run(self):
-        """执行线程的主方法"""
+        """线程池工作线程中执行的主方法"""
         try:
             # 执行任务
-            self.logger.debug(f"开始在线程中执行任务: {self.task_id}")
+            self.logger.debug(f"开始在线程池中执行任务: {self.task_id}")
             result = self.scheduler.run_task_now(self.task_id)
-            
+
             # 发送完成信号
-            self.taskFinished.emit(result)
-            
+            self.signals.taskFinished.emit(result)
+
         except Exception as e:
             # 记录错误
             error_msg = f"任务执行线程异常: {str(e)}"
             self.logger.error(error_msg)
-            
+
             # 发送错误信号
-            self.taskError.emit(error_msg)
-            
+            self.signals.taskError.emit(error_msg)
+
             # 发送完成信号，结果为None
-            self.taskFinished.emit(None) 
\ No newline at end of file
+            self.signals.taskFinished.emit(None)
@@ -3,42 +3,60 @@ Win-Task 任务类型模块
 """
 
 import importlib
-import inspect
 import logging
-import pkgutil
-from types import ModuleType
 from typing import Dict, Type
-from src.core.task import BaseTask
+from src.core.task import BaseTask, TASK_REGISTRY
 
 logger = logging.getLogger("tasks")
 
-# 存储所有任务类型
+# 任务类名到所在模块的映射：类在首次引用时才导入（PEP 562），
+# 包导入本身近乎零成本。新增任务模块时在此登记即可
+_NAME_TO_MODULE = {
+    "DBTask": "db_task",
+    "FileTask": "file_task",
+    "ProgramTask": "program_task",
+    "SystemTask": "system_task",
+    "URLTask": "url_task",
+}
+
+# 已加载的任务类型（按需填充；需要完整清单时调用 load_all()）
 TASK_CLASSES: Dict[str, Type[BaseTask]] = {}
 
-def _load_task_modules():
-    """通过 pkgutil 遍历子模块，注册任务类型。
 
-    采用 pkgutil.iter_modules(__path__) 而不是 os.listdir，
-    以便在 PyInstaller 等打包环境中也能正常工作。
+def __getattr__(name):
+    """按需导入任务类（模块级延迟加载）"""
+    module_name = _NAME_TO_MODULE.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    importlib.import_module(f"{__name__}.{module_name}")
+
+    # BaseTask.__init_subclass__ 已在模块导入时把任务类登记到 TASK_REGISTRY
+    cls = TASK_REGISTRY[name]
+    globals()[name] = cls  # 缓存到命名空间，后续访问不再走 __getattr__
+    TASK_CLASSES[name] = cls
+    return cls
+
+
+def load_all():
     """
-    for module_info in pkgutil.iter_modules(__path__):
-        name = module_info.name  # 模块名（不含包前缀）
-        if not name.endswith("_task"):
-            continue  # 只加载 *_task.py 模块
-        full_module_name = f"{__name__}.{name}"
+    导入全部任务模块
+
+    返回:
+        dict: 完整的任务类型映射
+    """
+    for module_name in set(_NAME_TO_MODULE.values()):
         try:
-            module: ModuleType = importlib.import_module(full_module_name)
-            # 查找模块中的 BaseTask 子类
-            for attr_name, obj in inspect.getmembers(module, inspect.isclass):
-                if issubclass(obj, BaseTask) and obj is not BaseTask and obj.__module__ == full_module_name:
-                    TASK_CLASSES[attr_name] = obj
-                    globals()[attr_name] = obj  # 导出到当前命名空间
-                    logger.debug("已注册任务类型: %s (%s)", attr_name, full_module_name)
+            importlib.import_module(f"{__name__}.{module_name}")
         except Exception as exc:
-            logger.error("加载任务模块 %s 失败: %s", full_module_name, exc)
+            logger.error("加载任务模块 %s.%s 失败: %s", __name__, module_name, exc)
+
+    TASK_CLASSES.update(TASK_REGISTRY)
+    for cls_name, cls in TASK_CLASSES.items():
+        globals()[cls_name] = cls
+
+    return TASK_CLASSES
 
-# 执行加载
-_load_task_modules()
 
 # 导出所有任务类名，供 * 号导入
-__all__ = list(TASK_CLASSES.keys()) 
\ No newline at end of file
+__all__ = list(_NAME_TO_MODULE.keys())
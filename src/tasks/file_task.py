@@ -8,14 +8,27 @@
 """
 
 import os
+import re
+import sys
+import zlib
 import shutil
+import fnmatch
 import logging
 import datetime
+import tarfile
 import zipfile
+import collections
+import concurrent.futures
 from pathlib import Path
 
 from src.core.task import BaseTask, TaskStatus, TaskResult
 
+# zstd归档为可选能力，未安装时回退zip
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 
 class FileOperationType:
     """文件操作类型枚举"""
@@ -42,8 +55,8 @@ class FileTask(BaseTask):
             source_path (str, optional): 源文件/目录路径
             target_path (str, optional): 目标文件/目录路径
             overwrite (bool, optional): 是否覆盖已存在的文件
-            include_pattern (str, optional): 包含的文件模式，如"*.txt"
-            exclude_pattern (str, optional): 排除的文件模式，如"*.tmp"
+            include_pattern (str|list, optional): 包含的文件模式，如"*.txt"或["*.txt", "*.md"]
+            exclude_pattern (str|list, optional): 排除的文件模式，如"*.tmp"
         """
         super().__init__(name, description)
         
@@ -59,6 +72,24 @@ class FileTask(BaseTask):
         self.create_target_dir = True
         self.preserve_metadata = True
         self.follow_symlinks = True
+        # 归档选项：deflate一级已接近六级的压缩比但快一倍以上；
+        # 级别0改用ZIP_STORED彻底跳过压缩。compression_method可选
+        # 'zip'或'tar.zst'（多线程zstd，需安装zstandard，否则回退zip）
+        self.compression_level = 1
+        self.compression_method = 'zip'
+        # 目录复制并发数：1保持原串行行为；网络盘/慢速盘上单文件复制
+        # 受I/O往返支配，调到min(32, CPU*4)可近线性提升吞吐
+        self.max_workers = 1
+
+        # zip归档的deflate并发数：zlib压缩期间释放GIL，多线程即可
+        # 吃满多核；1退回zipfile的串行写入
+        self.compress_workers = os.cpu_count() or 1
+
+        # 包含/排除glob的预编译缓存，首次匹配时构建
+        self._pattern_cache = None
+
+        # 单次执行内共享的树扫描结果，每次run()开始时清空
+        self._scan_cache = None
     
     def run(self):
         """
@@ -86,7 +117,10 @@ class FileTask(BaseTask):
                 self.logger.error(error_msg)
                 result.complete(TaskStatus.FAILED, -1, "", error_msg)
                 return result
-            
+
+            # 每次执行重新扫描目录树，扫描结果只在本次执行内复用
+            self._scan_cache = None
+
             # 根据操作类型执行相应操作
             if self.operation == FileOperationType.COPY:
                 success, message = self._copy_operation()
@@ -164,9 +198,109 @@ class FileTask(BaseTask):
             return False, f"目标文件已存在且未设置覆盖: {self.target_path}"
         
         # 复制文件
-        shutil.copy2(self.source_path, self.target_path) if self.preserve_metadata else shutil.copy(self.source_path, self.target_path)
-        
+        self._fast_copyfile(self.source_path, self.target_path)
+
         return True, f"复制文件 {self.source_path} 到 {self.target_path}"
+
+    def _fast_copyfile(self, src, dst):
+        """
+        用平台原生原语复制单个文件
+
+        Windows走CopyFileW（内核侧复制，比Python层read/write快一个
+        数量级），Linux走copy_file_range/sendfile零拷贝，其余平台
+        回退shutil.copyfile。preserve_metadata时再补一次copystat。
+
+        参数:
+            src (str): 源文件路径
+            dst (str): 目标文件或目录路径
+        """
+        # 与shutil.copy/copy2一致：目标是目录时拼上源文件名
+        if os.path.isdir(dst):
+            dst = os.path.join(dst, os.path.basename(src))
+
+        if os.name == 'nt':
+            import ctypes
+            if ctypes.windll.kernel32.CopyFileW(src, dst, 0) == 0:
+                raise ctypes.WinError()
+        elif sys.platform.startswith('linux'):
+            self._kernel_copyfile(src, dst)
+        else:
+            # macOS等平台sendfile只接受socket目标，shutil.copyfile
+            # 内部已按平台选用fcopyfile等原生快速路径
+            shutil.copyfile(src, dst)
+
+        if self.preserve_metadata:
+            shutil.copystat(src, dst)
+
+    @staticmethod
+    def _buffered_copyfile(src, dst):
+        """
+        通用回退复制：固定1MiB缓冲的readinto循环
+
+        shutil.copyfileobj每轮read都新分配一块bytes，大文件上是每
+        兆一次的分配回收；readinto反复写入同一个bytearray，经
+        memoryview切片零拷贝写出。buffering=0绕开io层的二次缓冲。
+
+        参数:
+            src (str): 源文件路径
+            dst (str): 目标文件路径
+        """
+        buf = bytearray(1 << 20)
+        view = memoryview(buf)
+        with open(src, 'rb', buffering=0) as fsrc, \
+                open(dst, 'wb', buffering=0) as fdst:
+            while True:
+                n = fsrc.readinto(buf)
+                if not n:
+                    break
+                fdst.write(view[:n])
+
+    @staticmethod
+    def _kernel_copyfile(src, dst):
+        """
+        内核侧复制：copy_file_range优先，sendfile兜底
+
+        数据在内核内直接搬运，不经用户态缓冲往返。
+
+        参数:
+            src (str): 源文件路径
+            dst (str): 目标文件路径
+        """
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            src_fd = fsrc.fileno()
+            dst_fd = fdst.fileno()
+            size = os.fstat(src_fd).st_size
+            copied = 0
+
+            # st_size为0的特殊文件（/proc等）直接走sendfile读到EOF
+            if size and hasattr(os, 'copy_file_range'):
+                try:
+                    while copied < size:
+                        sent = os.copy_file_range(src_fd, dst_fd, size - copied)
+                        if sent == 0:
+                            break
+                        copied += sent
+                    if copied >= size:
+                        return
+                except OSError:
+                    # 跨文件系统/旧内核上copy_file_range可能报EXDEV、
+                    # EINVAL；尚未写入任何数据时安全回退
+                    if copied:
+                        raise
+
+            try:
+                while True:
+                    sent = os.sendfile(dst_fd, src_fd, copied, 1 << 24)
+                    if sent == 0:
+                        return
+                    copied += sent
+            except OSError:
+                # 个别文件系统不支持sendfile文件到文件；尚未写入
+                # 任何数据时安全回退到缓冲复制
+                if copied:
+                    raise
+
+        FileTask._buffered_copyfile(src, dst)
     
     def _copy_directory(self):
         """
@@ -176,50 +310,51 @@ class FileTask(BaseTask):
             tuple: (成功标志, 消息)
         """
         # 统计信息
-        copied_files = 0
         skipped_files = 0
-        
+
         # 如果目标存在且不覆盖
         if os.path.exists(self.target_path) and not self.overwrite:
             return False, f"目标目录已存在且未设置覆盖: {self.target_path}"
-        
+
         # 如果目标路径是文件
         if os.path.exists(self.target_path) and os.path.isfile(self.target_path):
             return False, f"目标路径是文件，无法复制目录到文件: {self.target_path}"
-        
+
         # 确保目标目录存在
         if not os.path.exists(self.target_path):
             os.makedirs(self.target_path)
-        
-        # 遍历源目录
-        for root, dirs, files in os.walk(self.source_path):
-            # 计算相对路径
-            rel_path = os.path.relpath(root, self.source_path)
-            target_dir = os.path.join(self.target_path, rel_path) if rel_path != '.' else self.target_path
-            
-            # 创建目标子目录
-            if not os.path.exists(target_dir):
-                os.makedirs(target_dir)
-            
-            # 复制文件
-            for file in files:
-                source_file = os.path.join(root, file)
-                target_file = os.path.join(target_dir, file)
-                
-                # 检查文件是否匹配包含/排除模式
-                if not self._is_file_included(source_file):
-                    skipped_files += 1
-                    continue
-                
-                # 检查目标文件是否存在
-                if os.path.exists(target_file) and not self.overwrite:
-                    skipped_files += 1
-                    continue
-                
-                # 复制文件
-                shutil.copy2(source_file, target_file) if self.preserve_metadata else shutil.copy(source_file, target_file)
-                copied_files += 1
-        
+
+        # 共享的树扫描给出目录结构和过滤后的文件清单
+        rel_dirs, rel_files = self._collect_files()
+
+        # 创建目标子目录（含空目录）
+        for rel_dir in rel_dirs:
+            os.makedirs(os.path.join(self.target_path, rel_dir), exist_ok=True)
+
+        copy_jobs = []
+        for rel_file in rel_files:
+            target_file = os.path.join(self.target_path, rel_file)
+
+            # 检查目标文件是否存在
+            if os.path.exists(target_file) and not self.overwrite:
+                skipped_files += 1
+                continue
+
+            copy_jobs.append((os.path.join(self.source_path, rel_file), target_file))
+
+        # 复制文件：max_workers>1时经线程池并发，叠加I/O等待时间
+        copy_func = self._fast_copyfile
+        if self.max_workers > 1 and len(copy_jobs) > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='file-copy') as pool:
+                # list()收拢结果，worker里的异常在此抛回主线程
+                list(pool.map(lambda job: copy_func(*job), copy_jobs))
+        else:
+            for source_file, target_file in copy_jobs:
+                copy_func(source_file, target_file)
+        copied_files = len(copy_jobs)
+
         return True, f"复制目录完成，复制了 {copied_files} 个文件，跳过了 {skipped_files} 个文件"
     
     def _move_operation(self):
@@ -284,51 +419,225 @@ class FileTask(BaseTask):
                 filename = os.path.basename(self.source_path)
                 self.target_path = f"{self.source_path}.{timestamp}.bak"
             
-            # 创建ZIP备份
+            # 创建归档备份
             if self.source_path.endswith('/') or self.source_path.endswith('\\'):
                 self.source_path = self.source_path[:-1]
-                
-            zip_name = self.target_path if self.target_path.endswith('.zip') else f"{self.target_path}.zip"
-            
-            # 确保目标目录存在
-            if self.create_target_dir:
-                target_dir = os.path.dirname(zip_name)
-                if target_dir:
-                    os.makedirs(target_dir, exist_ok=True)
-            
-            # 创建ZIP文件
-            with zipfile.ZipFile(zip_name, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # 如果源是目录
-                if os.path.isdir(self.source_path):
-                    # 记录原始当前目录并切换到源目录的父目录
-                    base_name = os.path.basename(self.source_path)
-                    parent_dir = os.path.dirname(self.source_path)
-                    
-                    # 遍历目录
-                    for root, dirs, files in os.walk(self.source_path):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            
-                            # 检查文件是否匹配包含/排除模式
-                            if not self._is_file_included(file_path):
-                                continue
-                            
-                            # 计算归档内的路径
-                            if parent_dir:
-                                archive_path = os.path.join(base_name, os.path.relpath(file_path, self.source_path))
-                            else:
-                                archive_path = os.path.relpath(file_path, os.path.dirname(self.source_path))
-                            
-                            # 添加到ZIP
-                            zipf.write(file_path, archive_path)
-                else:
-                    # 源是文件
-                    zipf.write(self.source_path, os.path.basename(self.source_path))
-            
-            return True, f"备份 {self.source_path} 到 {zip_name}"
-            
+
+            archive_name = self._write_archive(self.target_path)
+
+            return True, f"备份 {self.source_path} 到 {archive_name}"
+
         except Exception as e:
             return False, f"备份操作异常: {str(e)}"
+
+    def _archive_members(self):
+        """
+        迭代待归档的(文件路径, 归档内路径)对
+
+        返回:
+            generator: (file_path, archive_path) 二元组
+        """
+        if os.path.isdir(self.source_path):
+            base_name = os.path.basename(self.source_path)
+
+            # 归档内路径统一带上源目录名作前缀
+            for rel_file in self._collect_files()[1]:
+                yield (os.path.join(self.source_path, rel_file),
+                       os.path.join(base_name, rel_file))
+        else:
+            # 源是文件
+            yield self.source_path, os.path.basename(self.source_path)
+
+    def _collect_files(self):
+        """
+        取源目录的(相对子目录元组, 过滤后相对文件元组)
+
+        结果只在单次run()内缓存（每次执行开始时清空）：同一次执行
+        里的多个消费方共享一遍扫描，而下一次执行总是重新枚举，目录
+        树深处的增删不会被旧清单漏掉。
+
+        返回:
+            tuple: (rel_dirs, rel_files)
+        """
+        if self._scan_cache is None:
+            include_re, exclude_re = self._compiled_patterns()
+            self._scan_cache = self._scan_tree(
+                self.source_path, include_re, exclude_re, self.follow_symlinks)
+        return self._scan_cache
+
+    @staticmethod
+    def _scan_tree(root, include_re, exclude_re, follow_symlinks):
+        """
+        用os.scandir枚举目录树，返回排序后的(相对目录, 相对文件)元组
+
+        scandir直接复用readdir带回的条目类型信息，不像os.walk那样
+        给每个条目补一次stat，在Windows和网络盘上枚举快数倍。文件
+        按路径排序，归档时压缩器的局部性更好。
+
+        参数:
+            root (str): 遍历起点目录
+            include_re (re.Pattern|None): 预编译的包含正则
+            exclude_re (re.Pattern|None): 预编译的排除正则
+            follow_symlinks (bool): 是否深入符号链接指向的目录；指向
+                文件的符号链接在两种模式下都按文件收集
+
+        返回:
+            tuple: (相对目录元组, 过滤后的相对文件元组)
+        """
+        dirs = []
+        files = []
+        # 已深入目录的(设备号, inode)集合：符号链接可能指回祖先目录
+        # 形成环，去重后遍历保证终止
+        try:
+            root_stat = os.stat(root)
+            visited = {(root_stat.st_dev, root_stat.st_ino)}
+        except OSError:
+            visited = set()
+        stack = [root]
+        while stack:
+            dirpath = stack.pop()
+            with os.scandir(dirpath) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=True):
+                        dirs.append(os.path.relpath(entry.path, root))
+                        if entry.is_symlink():
+                            # 链接目录仅在跟随模式下深入，且目标目录
+                            # 去重防环（目录本身仍会在目标端创建）
+                            if not follow_symlinks:
+                                continue
+                            try:
+                                st = entry.stat()
+                            except OSError:
+                                continue
+                            key = (st.st_dev, st.st_ino)
+                            if key in visited:
+                                continue
+                            visited.add(key)
+                        stack.append(entry.path)
+                        continue
+                    if not entry.is_file(follow_symlinks=True):
+                        continue
+
+                    # 检查文件是否匹配包含/排除模式
+                    name = os.path.normcase(entry.name)
+                    if exclude_re is not None and exclude_re.match(name):
+                        continue
+                    if include_re is not None and not include_re.match(name):
+                        continue
+
+                    files.append(os.path.relpath(entry.path, root))
+
+        return tuple(sorted(dirs)), tuple(sorted(files))
+
+    def _write_archive(self, target_path):
+        """
+        按压缩配置把源写成归档文件
+
+        参数:
+            target_path (str): 目标路径（按归档格式补全扩展名）
+
+        返回:
+            str: 实际生成的归档文件路径
+        """
+        use_zstd = self.compression_method == 'tar.zst' and zstandard is not None
+
+        # 按归档格式补全扩展名
+        suffix = '.tar.zst' if use_zstd else '.zip'
+        archive_name = target_path if target_path.endswith(suffix) else f"{target_path}{suffix}"
+
+        # 确保目标目录存在
+        if self.create_target_dir:
+            target_dir = os.path.dirname(archive_name)
+            if target_dir:
+                os.makedirs(target_dir, exist_ok=True)
+
+        if use_zstd:
+            # tar流经zstd压缩器直接落盘，threads=-1按CPU核数并行压缩
+            with open(archive_name, 'wb') as out_f:
+                cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+                with cctx.stream_writer(out_f) as writer:
+                    with tarfile.open(fileobj=writer, mode='w|') as tar:
+                        for file_path, archive_path in self._archive_members():
+                            tar.add(file_path, arcname=archive_path, recursive=False)
+        elif self.compress_workers > 1 and self.compression_level > 0:
+            self._write_zip_parallel(archive_name)
+        else:
+            with self._open_zip(archive_name) as zipf:
+                for file_path, archive_path in self._archive_members():
+                    zipf.write(file_path, archive_path)
+
+        return archive_name
+
+    def _write_zip_parallel(self, archive_name):
+        """
+        多线程deflate后按序写入zip
+
+        zipfile逐文件在单核上压缩；这里把deflate扔进线程池（zlib
+        压缩期间释放GIL，线程即可并行），主线程按提交顺序把压缩好
+        的成员写进归档。提交窗口限制在工作线程数的两倍，压缩结果
+        不会在内存里无界堆积。
+
+        参数:
+            archive_name (str): 目标zip文件路径
+        """
+        with zipfile.ZipFile(archive_name, 'w', zipfile.ZIP_DEFLATED,
+                             compresslevel=self.compression_level) as zipf:
+            pending = collections.deque()
+            with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.compress_workers,
+                    thread_name_prefix='zip-deflate') as pool:
+                for file_path, archive_path in self._archive_members():
+                    pending.append(pool.submit(self._deflate_member,
+                                               file_path, archive_path))
+                    if len(pending) >= self.compress_workers * 2:
+                        self._append_deflated(zipf, pending.popleft().result())
+                while pending:
+                    self._append_deflated(zipf, pending.popleft().result())
+
+    def _deflate_member(self, file_path, archive_path):
+        """
+        在工作线程里压缩单个归档成员
+
+        返回:
+            tuple: (ZipInfo, 压缩后字节串)
+        """
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        compressor = zlib.compressobj(self.compression_level, zlib.DEFLATED, -15)
+        compressed = compressor.compress(data) + compressor.flush()
+
+        zinfo = zipfile.ZipInfo.from_file(file_path, archive_path)
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.CRC = zlib.crc32(data)
+        zinfo.file_size = len(data)
+        zinfo.compress_size = len(compressed)
+        return zinfo, compressed
+
+    @staticmethod
+    def _append_deflated(zipf, member):
+        """
+        把预先压缩好的成员原样追加进zip
+
+        绕开ZipFile.write的再压缩：直接写本地文件头和压缩数据，并
+        登记到目录表。动用的fp/filelist/NameToInfo/start_dir属性在
+        历代CPython的zipfile里保持稳定。
+        """
+        zinfo, compressed = member
+        zip64 = (zinfo.file_size > zipfile.ZIP64_LIMIT or
+                 zinfo.compress_size > zipfile.ZIP64_LIMIT)
+        zinfo.header_offset = zipf.fp.tell()
+        zipf.fp.write(zinfo.FileHeader(zip64))
+        zipf.fp.write(compressed)
+        zipf.filelist.append(zinfo)
+        zipf.NameToInfo[zinfo.filename] = zinfo
+        zipf.start_dir = zipf.fp.tell()
+
+    def _open_zip(self, zip_path):
+        """按压缩级别打开待写入的zip归档；级别0直接存储，跳过deflate"""
+        if self.compression_level == 0:
+            return zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED)
+        return zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED,
+                               compresslevel=self.compression_level)
     
     def _zip_operation(self):
         """
@@ -338,40 +647,14 @@ class FileTask(BaseTask):
             tuple: (成功标志, 消息)
         """
         try:
-            # 如果没有指定目标路径，创建默认zip文件名
+            # 如果没有指定目标路径，创建默认归档文件名（扩展名由归档格式决定）
             if not self.target_path:
-                self.target_path = f"{self.source_path}.zip"
-            
-            # 确保目标目录存在
-            if self.create_target_dir:
-                target_dir = os.path.dirname(self.target_path)
-                if target_dir:
-                    os.makedirs(target_dir, exist_ok=True)
-            
-            # 创建ZIP文件
-            with zipfile.ZipFile(self.target_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                # 如果源是目录
-                if os.path.isdir(self.source_path):
-                    # 遍历目录
-                    for root, dirs, files in os.walk(self.source_path):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            
-                            # 检查文件是否匹配包含/排除模式
-                            if not self._is_file_included(file_path):
-                                continue
-                            
-                            # 计算归档内的路径
-                            archive_path = os.path.relpath(file_path, os.path.dirname(self.source_path))
-                            
-                            # 添加到ZIP
-                            zipf.write(file_path, archive_path)
-                else:
-                    # 源是文件
-                    zipf.write(self.source_path, os.path.basename(self.source_path))
-            
+                self.target_path = self.source_path
+
+            self.target_path = self._write_archive(self.target_path)
+
             return True, f"压缩 {self.source_path} 到 {self.target_path}"
-            
+
         except Exception as e:
             return False, f"压缩操作异常: {str(e)}"
     
@@ -419,21 +702,69 @@ class FileTask(BaseTask):
         返回:
             bool: 是否包含该文件
         """
-        filename = os.path.basename(filepath)
-        
+        return self._is_name_included(os.path.basename(filepath))
+
+    def _is_name_included(self, filename):
+        """
+        检查文件名是否应该被包含（基于包含/排除模式）
+
+        遍历目录时DirEntry.name已是纯文件名，走此入口省去basename。
+
+        参数:
+            filename (str): 文件名（不含目录部分）
+
+        返回:
+            bool: 是否包含该文件
+        """
+        include_re, exclude_re = self._compiled_patterns()
+        name = os.path.normcase(filename)
+
         # 如果有排除模式，检查是否被排除
-        if self.exclude_pattern:
-            import fnmatch
-            if fnmatch.fnmatch(filename, self.exclude_pattern):
-                return False
-        
-        # 如果有包含模式，检查是否被包含
-        if self.include_pattern:
-            import fnmatch
-            return fnmatch.fnmatch(filename, self.include_pattern)
-        
-        # 默认包含所有文件
-        return True
+        if exclude_re is not None and exclude_re.match(name):
+            return False
+
+        # 如果有包含模式，检查是否被包含；默认包含所有文件
+        return include_re is None or include_re.match(name) is not None
+
+    def _compiled_patterns(self):
+        """
+        返回预编译的(包含正则, 排除正则)
+
+        glob每次fnmatch都要翻译成正则再匹配，大目录树上逐文件调用
+        代价可观；这里编译一次反复使用，模式被改动时自动重建。
+        normcase与fnmatch.fnmatch的平台大小写语义保持一致。
+        """
+        def freeze(patterns):
+            return tuple(patterns) if isinstance(patterns, list) else patterns
+
+        key = (freeze(self.include_pattern), freeze(self.exclude_pattern))
+        cached = self._pattern_cache
+        if cached is None or cached[0] != key:
+            cached = (key, self._translate_patterns(self.include_pattern),
+                      self._translate_patterns(self.exclude_pattern))
+            self._pattern_cache = cached
+        return cached[1], cached[2]
+
+    @staticmethod
+    def _translate_patterns(patterns):
+        """
+        把一个或一组glob合并编译成单个正则
+
+        多个模式按|拼成一条交替式，一次扫描即可判定全部模式，匹配
+        代价不随模式数量增长。
+
+        参数:
+            patterns (str|list): glob模式或模式列表
+
+        返回:
+            re.Pattern|None: 合并后的正则，无模式时为None
+        """
+        if not patterns:
+            return None
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        return re.compile('|'.join(
+            f'(?:{fnmatch.translate(os.path.normcase(p))})' for p in patterns))
     
     def _is_path_included(self, path):
         """
@@ -445,20 +776,17 @@ class FileTask(BaseTask):
         返回:
             bool: 是否包含该路径
         """
-        basename = os.path.basename(path)
-        
+        include_re, exclude_re = self._compiled_patterns()
+        norm_path = os.path.normcase(path)
+        basename = os.path.basename(norm_path)
+
         # 如果有排除模式，检查是否被排除
-        if self.exclude_pattern:
-            import fnmatch
-            if fnmatch.fnmatch(basename, self.exclude_pattern) or fnmatch.fnmatch(path, self.exclude_pattern):
-                return False
-        
-        # 如果有包含模式，检查是否被包含
-        if self.include_pattern:
-            import fnmatch
-            return fnmatch.fnmatch(basename, self.include_pattern) or fnmatch.fnmatch(path, self.include_pattern)
-        
-        # 默认包含所有路径
+        if exclude_re is not None and (exclude_re.match(basename) or exclude_re.match(norm_path)):
+            return False
+
+        # 如果有包含模式，检查是否被包含；默认包含所有路径
+        if include_re is not None:
+            return bool(include_re.match(basename) or include_re.match(norm_path))
         return True
     
     def to_dict(self):
@@ -480,7 +808,11 @@ class FileTask(BaseTask):
             'exclude_pattern': self.exclude_pattern,
             'create_target_dir': self.create_target_dir,
             'preserve_metadata': self.preserve_metadata,
-            'follow_symlinks': self.follow_symlinks
+            'follow_symlinks': self.follow_symlinks,
+            'compression_level': self.compression_level,
+            'compression_method': self.compression_method,
+            'max_workers': self.max_workers,
+            'compress_workers': self.compress_workers
         })
         
         return data
@@ -508,5 +840,9 @@ class FileTask(BaseTask):
         task.create_target_dir = data.get('create_target_dir', True)
         task.preserve_metadata = data.get('preserve_metadata', True)
         task.follow_symlinks = data.get('follow_symlinks', True)
-        
+        task.compression_level = data.get('compression_level', 1)
+        task.compression_method = data.get('compression_method', 'zip')
+        task.max_workers = data.get('max_workers', 1)
+        task.compress_workers = data.get('compress_workers', os.cpu_count() or 1)
+
         return task 
\ No newline at end of file
@@ -12,7 +12,6 @@ import sys
 import time
 import logging
 import subprocess
-import threading
 
 from src.core.task import BaseTask, TaskStatus, TaskResult
 
@@ -49,6 +48,10 @@ class ProgramTask(BaseTask):
         self.success_codes = [0]  # 表示成功的返回码
         self.encoding = 'utf-8'
         self.run_detached = False  # 是否作为独立进程运行
+        # 输出直写文件：设置后内核把对应管道数据直接落盘，Python侧
+        # 不解码不缓存，大输出命令的内存占用与输出量无关
+        self.stdout_file = None
+        self.stderr_file = None
     
     def run(self):
         """
@@ -91,75 +94,77 @@ class ProgramTask(BaseTask):
                 'env': env,
             }
             
+            # 输出直写文件的流不走管道，子进程经内核直接落盘；
+            # 未指定文件的流仍经管道捕获
+            stdout_f = None
+            stderr_f = None
             if self.capture_output:
+                if self.stdout_file:
+                    stdout_f = open(self.stdout_file, 'wb')
+                if self.stderr_file:
+                    stderr_f = open(self.stderr_file, 'wb')
+                # 文本模式只作用于管道端，文件句柄原样传递
                 kwargs.update({
-                    'stdout': subprocess.PIPE,
-                    'stderr': subprocess.PIPE,
+                    'stdout': stdout_f or subprocess.PIPE,
+                    'stderr': stderr_f or subprocess.PIPE,
                     'universal_newlines': True,
                     'encoding': self.encoding
                 })
-            
+
             # 如果是Windows并且要求分离运行
             if self.run_detached and os.name == 'nt':
                 kwargs.update({
                     'creationflags': subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
                 })
-            
-            # 启动进程
-            process = subprocess.Popen(**kwargs)
-            
-            # 是否等待完成
-            if self.wait_for_completion:
-                # 使用线程读取输出，避免阻塞
-                stdout_data = ""
-                stderr_data = ""
-                
-                if self.capture_output:
-                    stdout_thread = threading.Thread(
-                        target=self._read_output_stream,
-                        args=(process.stdout, lambda x: stdout_data + x)
-                    )
-                    stderr_thread = threading.Thread(
-                        target=self._read_output_stream,
-                        args=(process.stderr, lambda x: stderr_data + x)
-                    )
-                    
-                    stdout_thread.daemon = True
-                    stderr_thread.daemon = True
-                    
-                    stdout_thread.start()
-                    stderr_thread.start()
-                
-                # 等待进程完成
-                return_code = process.wait()
-                
-                # 等待输出线程完成
-                if self.capture_output:
-                    stdout_thread.join(1)
-                    stderr_thread.join(1)
-                
-                # 处理结果
-                if return_code in self.success_codes:
-                    status = TaskStatus.SUCCESS
-                else:
-                    status = TaskStatus.FAILED
-                
-                result.complete(status, return_code, stdout_data, stderr_data)
-                
-                # 日志记录
-                if status == TaskStatus.SUCCESS:
-                    self.logger.info(f"命令执行成功，返回码: {return_code}")
+
+            try:
+                # 启动进程
+                process = subprocess.Popen(**kwargs)
+
+                # 是否等待完成
+                if self.wait_for_completion:
+                    stdout_data = ""
+                    stderr_data = ""
+
+                    if self.capture_output:
+                        # communicate内部用选择器并发排空两个管道，既不用
+                        # 再起读线程，也不会像join(1)那样截断收尾输出；
+                        # 直写文件的流在此返回None
+                        stdout_data, stderr_data = process.communicate()
+                        return_code = process.returncode
+                        stdout_data = stdout_data or ""
+                        stderr_data = stderr_data or ""
+                    else:
+                        # 等待进程完成
+                        return_code = process.wait()
+
+                    # 处理结果
+                    if return_code in self.success_codes:
+                        status = TaskStatus.SUCCESS
+                    else:
+                        status = TaskStatus.FAILED
+
+                    result.complete(status, return_code, stdout_data, stderr_data)
+
+                    # 日志记录
+                    if status == TaskStatus.SUCCESS:
+                        self.logger.info(f"命令执行成功，返回码: {return_code}")
+                    else:
+                        self.logger.error(f"命令执行失败，返回码: {return_code}")
+                        if stderr_data:
+                            self.logger.error(f"错误输出: {stderr_data}")
+
+                    return result
                 else:
-                    self.logger.error(f"命令执行失败，返回码: {return_code}")
-                    if stderr_data:
-                        self.logger.error(f"错误输出: {stderr_data}")
-                
-                return result
-            else:
-                # 不等待完成，直接返回
-                self.logger.info(f"启动命令 (PID: {process.pid}) 并不等待完成")
-                result.complete(TaskStatus.SUCCESS, 0, f"进程已启动，PID: {process.pid}")
-                return result
+                    # 不等待完成，直接返回（子进程持有文件句柄的副本）
+                    self.logger.info(f"启动命令 (PID: {process.pid}) 并不等待完成")
+                    result.complete(TaskStatus.SUCCESS, 0, f"进程已启动，PID: {process.pid}")
+                    return result
+            finally:
+                if stdout_f is not None:
+                    stdout_f.close()
+                if stderr_f is not None:
+                    stderr_f.close()
             
         except Exception as e:
             error_msg = f"任务执行异常: {str(e)}"
@@ -167,17 +172,6 @@ class ProgramTask(BaseTask):
             result.complete(TaskStatus.FAILED, -1, "", error_msg)
             return result
     
-    def _read_output_stream(self, stream, append_func):
-        """
-        读取输出流
-        
-        参数:
-            stream: 流对象
-            append_func: 追加数据的函数
-        """
-        for line in iter(stream.readline, ''):
-            append_func(line)
-    
     def to_dict(self):
         """
         将任务转换为字典用于序列化
@@ -198,7 +192,9 @@ class ProgramTask(BaseTask):
             'wait_for_completion': self.wait_for_completion,
             'success_codes': self.success_codes,
             'encoding': self.encoding,
-            'run_detached': self.run_detached
+            'run_detached': self.run_detached,
+            'stdout_file': self.stdout_file,
+            'stderr_file': self.stderr_file
         })
         
         return data
@@ -227,5 +223,7 @@ class ProgramTask(BaseTask):
         task.success_codes = data.get('success_codes', [0])
         task.encoding = data.get('encoding', 'utf-8')
         task.run_detached = data.get('run_detached', False)
-        
+        task.stdout_file = data.get('stdout_file')
+        task.stderr_file = data.get('stderr_file')
+
         return task 
\ No newline at end of file
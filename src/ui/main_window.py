@@ -26,7 +26,7 @@ from src.core.task import TaskStatus, TaskPriority
 from src.core.scheduler import TaskScheduler
 from src.core.settings import Settings
 from src.ui.task_dialog import TaskDialog
-from src.core.task_execution_thread import TaskExecutionThread
+from src.core.task_execution_thread import TaskRunnable
 from src.utils.path_utils import get_app_data_dir
 
 
@@ -708,13 +708,15 @@ class MainWindow(QMainWindow):
                 time_str = exec_time.strftime("%Y-%m-%d %H:%M:%S") if isinstance(exec_time, datetime) else str(exec_time)
                 self.recent_tasks_table.setItem(row, 2, QTableWidgetItem(time_str))
                 
-                # 状态
-                status_item = QTableWidgetItem(history['status'])
-                if history['status'] == TaskStatus.SUCCESS.value:
+                # 状态（内存中的新记录保存枚举，持久化加载的旧记录是字符串）
+                status = history['status']
+                status_value = status.value if isinstance(status, TaskStatus) else status
+                status_item = QTableWidgetItem(status_value)
+                if status_value == TaskStatus.SUCCESS.value:
                     status_item.setBackground(QColor(200, 255, 200))  # 浅绿色
-                elif history['status'] == TaskStatus.FAILED.value:
+                elif status_value == TaskStatus.FAILED.value:
                     status_item.setBackground(QColor(255, 200, 200))  # 浅红色
-                elif history['status'] == TaskStatus.RUNNING.value:
+                elif status_value == TaskStatus.RUNNING.value:
                     status_item.setBackground(QColor(200, 200, 255))  # 浅蓝色
                 self.recent_tasks_table.setItem(row, 3, status_item)
                 
@@ -1331,12 +1333,12 @@ class MainWindow(QMainWindow):
         progress.setAutoClose(True)
         progress.setCancelButton(None)  # 禁用取消按钮，因为我们不能中断任务执行
         
-        # 在后台线程中执行任务
-        self.task_thread = TaskExecutionThread(self.scheduler, task_id)
-        self.task_thread.taskFinished.connect(lambda result: self._handle_task_result(task_id, result))
-        self.task_thread.taskError.connect(self._handle_task_error)
-        self.task_thread.taskFinished.connect(progress.close)
-        self.task_thread.start()
+        # 提交到共享线程池执行，复用工作线程
+        self.task_runnable = TaskRunnable(self.scheduler, task_id)
+        self.task_runnable.signals.taskFinished.connect(lambda result: self._handle_task_result(task_id, result))
+        self.task_runnable.signals.taskError.connect(self._handle_task_error)
+        self.task_runnable.signals.taskFinished.connect(progress.close)
+        self.task_runnable.start()
         
         # 显示进度对话框
         progress.exec_()
@@ -21,6 +21,5 @@ def get_app_data_dir():
     else:  # Linux/Mac
         app_data = os.path.join(os.path.expanduser('~'), '.wintask')
     
-    if not os.path.exists(app_data):
-        os.makedirs(app_data)
+    os.makedirs(app_data, exist_ok=True)
     return app_data